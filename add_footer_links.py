@@ -8,18 +8,23 @@ from datetime import datetime
 import os
 import glob
 
-# Fix emoji output on Windows terminals
-if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-# Get today's date
-date_str = datetime.now().strftime('%Y-%m-%d')
+def add_footer(dossier_path='dossier.html', now=None):
+    """
+    Insert or refresh the Complete Databases footer in the dossier
 
-# Find all Daily folders for today
-daily_folders = sorted(glob.glob(f'Daily/{date_str}-*'))
+    Args:
+        dossier_path: Dossier HTML file to edit in place
+        now: Run timestamp used to pick today's Daily folders
+    """
+    # Get today's date
+    date_str = (now or datetime.now()).strftime('%Y-%m-%d')
 
-# Build footer HTML
-footer_html = '''
+    # Find all Daily folders for today
+    daily_folders = sorted(glob.glob(f'Daily/{date_str}-*'))
+
+    # Build footer HTML
+    footer_html = '''
 <hr style="margin: 60px 0 40px 0; border: none; border-top: 1px solid var(--border);">
 
 <div style="text-align: center; padding: 30px 0;">
@@ -30,12 +35,12 @@ footer_html = '''
     <div style="display: flex; gap: 20px; justify-content: center; flex-wrap: wrap;">
 '''
 
-# Add links for each Daily folder found
-for folder in daily_folders:
-    folder_name = os.path.basename(folder)  # e.g., "2026-02-07-6AM" or "2026-02-07-5PM"
-    time_label = folder_name.split('-')[-1]  # "6AM" or "5PM"
-    
-    footer_html += f'''
+    # Add links for each Daily folder found
+    for folder in daily_folders:
+        folder_name = os.path.basename(folder)  # e.g., "2026-02-07-6AM" or "2026-02-07-5PM"
+        time_label = folder_name.split('-')[-1]  # "6AM" or "5PM"
+
+        footer_html += f'''
         <a href="{folder}/all_items.html" style="
             display: inline-block;
             background: var(--accent);
@@ -50,7 +55,7 @@ for folder in daily_folders:
         </a>
 '''
 
-footer_html += '''
+    footer_html += '''
     </div>
     <p style="color: var(--text-secondary); font-size: 13px; margin-top: 20px;">
         <a href="https://github.com/DiamondDeals/daily-dossier/tree/master/Daily" style="color: var(--accent);">View All Historical Archives →</a>
@@ -58,23 +63,31 @@ footer_html += '''
 </div>
 '''
 
-# Read current dossier
-with open('dossier.html', 'r', encoding='utf-8') as f:
-    html = f.read()
-
-# Check if footer already exists
-if '📊 Complete Databases' in html:
-    # Replace existing footer
-    start = html.find('<hr style="margin: 60px 0 40px 0;')
-    end = html.find('</div>\n</main>', start)
-    if start > 0 and end > 0:
-        html = html[:start] + footer_html + '\n</main>' + html[html.find('</main>', end) + 7:]
-else:
-    # Add new footer before </main>
-    html = html.replace('</main>', footer_html + '\n</main>')
-
-# Save
-with open('dossier.html', 'w', encoding='utf-8') as f:
-    f.write(html)
-
-print(f"✅ Added footer with {len(daily_folders)} complete database link(s)")
+    # Read current dossier
+    with open(dossier_path, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    # Check if footer already exists
+    if '📊 Complete Databases' in html:
+        # Replace existing footer
+        start = html.find('<hr style="margin: 60px 0 40px 0;')
+        end = html.find('</div>\n</main>', start)
+        if start > 0 and end > 0:
+            html = html[:start] + footer_html + '\n</main>' + html[html.find('</main>', end) + 7:]
+    else:
+        # Add new footer before </main>
+        html = html.replace('</main>', footer_html + '\n</main>')
+
+    # Save
+    with open(dossier_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    print(f"✅ Added footer with {len(daily_folders)} complete database link(s)")
+
+
+if __name__ == "__main__":
+    # Fix emoji output on Windows terminals
+    if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+    add_footer()
@@ -6,6 +6,9 @@ Parse titles from URLs and add to complete database
 import re
 import json
 
+# Underscores and dashes in URL slugs become spaces, in one pass
+_SLUG_TRANS = str.maketrans('_-', '  ')
+
 def parse_title_from_url(url):
     """Extract title from URL slug"""
     
@@ -16,7 +19,7 @@ def parse_title_from_url(url):
         if match:
             slug = match.group(1)
             # Replace underscores and dashes with spaces, capitalize
-            title = slug.replace('_', ' ').replace('-', ' ')
+            title = slug.translate(_SLUG_TRANS)
             return title.title()
     
     # YouTube URLs: extract video title from v= parameter or path
@@ -41,7 +44,7 @@ def parse_title_from_url(url):
         match = re.search(r'/([^/]+)/?$', url.rstrip('/'))
         if match:
             slug = match.group(1)
-            title = slug.replace('_', ' ').replace('-', ' ')
+            title = slug.translate(_SLUG_TRANS)
             return title.title()
     
     return "Link"
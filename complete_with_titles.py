@@ -10,150 +10,202 @@ import re
 from datetime import datetime
 import os
 
-# Fix emoji output on Windows terminals
-if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-
-all_items = []
-
-# Run Reddit scanner and capture output
-print("🟠 Scanning Reddit...")
-result = subprocess.run(['python3', 'reddit_json_client.py'], 
-                       capture_output=True, encoding='utf-8', errors='replace', timeout=60)
-
-lines = result.stdout.split('\n')
-for i, line in enumerate(lines):
-    if re.match(r'^\d+\.', line.strip()):
-        title = re.sub(r'^\d+\.\s*', '', line.strip()).replace('...', '')
-        url = subreddit = score = ""
-        
-        for j in range(1, 6):
-            if i+j < len(lines):
-                if '🔗 https://www.reddit.com' in lines[i+j]:
-                    url = lines[i+j].split('🔗 ')[1].strip()
-                if '📍 r/' in lines[i+j]:
-                    m = re.search(r'r/(\w+)', lines[i+j])
-                    subreddit = m.group(1) if m else ""
-                if '📊 Engagement:' in lines[i+j]:
-                    score = lines[i+j].split('📊 ')[1].strip()
-        
-        if url:
-            all_items.append({
-                'platform': 'Reddit',
-                'title': title,
-                'summary': f"r/{subreddit} • {score}",
-                'url': url
-            })
-
-print(f"  Found {len([i for i in all_items if i['platform']=='Reddit'])} Reddit items")
-
-# Run Moltbook scanner
-print("🤖 Scanning Moltbook...")
-result = subprocess.run(['python3', 'moltbook_scanner.py'], 
-                       capture_output=True, encoding='utf-8', errors='replace', timeout=60)
-
-lines = result.stdout.split('\n')
-for i, line in enumerate(lines):
-    if line.strip().startswith('**') and re.match(r'\*\*\d+\.', line.strip()):
-        title = line.strip().replace('**', '')
-        title = re.sub(r'^\d+\.\s*', '', title)
-        url = score = ""
-        
-        for j in range(1, 6):
-            if i+j < len(lines):
-                if 'https://moltbook.com/post/' in lines[i+j]:
-                    url = lines[i+j].strip().replace('- ', '')
-                if 'Score:' in lines[i+j]:
-                    m = re.search(r'Score: (\d+)', lines[i+j])
-                    score = m.group(1) if m else ""
-        
-        if url:
-            all_items.append({
-                'platform': 'Moltbook',
-                'title': title,
-                'summary': f"Score: {score}",
-                'url': url
-            })
-
-print(f"  Found {len([i for i in all_items if i['platform']=='Moltbook'])} Moltbook items")
-
-# Run YouTube scanner
-print("🎥 Scanning YouTube...")
-result = subprocess.run(['python3', 'youtube_ai_monitor.py'], 
-                       capture_output=True, encoding='utf-8', errors='replace', timeout=60)
-
-lines = result.stdout.split('\n')
-for i, line in enumerate(lines):
-    if line.strip().startswith('**') and re.match(r'\*\*\d+\.', line.strip()):
-        title = line.strip().replace('**', '')
-        title = re.sub(r'^\d+\.\s*', '', title)
-        url = channel = ""
-        
-        for j in range(1, 4):
-            if i+j < len(lines):
-                if 'https://www.youtube.com' in lines[i+j]:
-                    url = lines[i+j].strip().replace('- ', '')
-                if 'Channel:' in lines[i+j]:
-                    channel = lines[i+j].split('Channel: ')[1].strip()
-        
-        if url:
-            all_items.append({
-                'platform': 'YouTube',
-                'title': title,
-                'summary': f"Channel: {channel}",
-                'url': url
-            })
-
-print(f"  Found {len([i for i in all_items if i['platform']=='YouTube'])} YouTube items")
-
-# Run RSS scanner
-print("📰 Scanning RSS...")
-result = subprocess.run(['python3', 'rss_news_scanner.py'], 
-                       capture_output=True, encoding='utf-8', errors='replace', timeout=60)
-
-lines = result.stdout.split('\n')
-for i, line in enumerate(lines):
-    if line.strip().startswith('**') and re.match(r'\*\*\d+\.', line.strip()):
-        title = line.strip().replace('**', '')
-        title = re.sub(r'^\d+\.\s*', '', title)
-        url = source = ""
-        
-        for j in range(1, 4):
-            if i+j < len(lines):
-                if 'Link: https://' in lines[i+j]:
-                    url = lines[i+j].split('Link: ')[1].strip()
-                elif '- https://' in lines[i+j]:
-                    url = lines[i+j].split('- ')[1].strip()
-                if '- ' in lines[i+j] and '•' in lines[i+j]:
-                    source = lines[i+j].split('- ')[1].split('•')[0].strip()
-        
-        if url:
-            all_items.append({
-                'platform': 'RSS',
-                'title': title,
-                'summary': source,
-                'url': url
-            })
-
-print(f"  Found {len([i for i in all_items if i['platform']=='RSS'])} RSS items")
-
-print(f"\n✅ Total: {len(all_items)} items with titles/summaries")
-
-# Save database
-database = {
-    'date': datetime.now().isoformat(),
-    'total': len(all_items),
-    'items': all_items
-}
-
-os.makedirs('Database', exist_ok=True)
-with open('Database/complete_with_titles.json', 'w') as f:
-    json.dump(database, f, indent=2)
-
-print(f"✅ Saved: Database/complete_with_titles.json")
-
-# Generate HTML
-html = f"""<!DOCTYPE html>
+
+def scan_items():
+    """Run each scanner as a script and parse titles/summaries from its output"""
+    all_items = []
+
+    # Run Reddit scanner and capture output
+    print("🟠 Scanning Reddit...")
+    result = subprocess.run(['python3', 'reddit_json_client.py'], 
+                           capture_output=True, encoding='utf-8', errors='replace', timeout=60)
+
+    lines = result.stdout.split('\n')
+    for i, line in enumerate(lines):
+        if re.match(r'^\d+\.', line.strip()):
+            title = re.sub(r'^\d+\.\s*', '', line.strip()).replace('...', '')
+            url = subreddit = score = ""
+
+            for j in range(1, 6):
+                if i+j < len(lines):
+                    if '🔗 https://www.reddit.com' in lines[i+j]:
+                        url = lines[i+j].split('🔗 ')[1].strip()
+                    if '📍 r/' in lines[i+j]:
+                        m = re.search(r'r/(\w+)', lines[i+j])
+                        subreddit = m.group(1) if m else ""
+                    if '📊 Engagement:' in lines[i+j]:
+                        score = lines[i+j].split('📊 ')[1].strip()
+
+            if url:
+                all_items.append({
+                    'platform': 'Reddit',
+                    'title': title,
+                    'summary': f"r/{subreddit} • {score}",
+                    'url': url
+                })
+
+    print(f"  Found {len([i for i in all_items if i['platform']=='Reddit'])} Reddit items")
+
+    # Run Moltbook scanner
+    print("🤖 Scanning Moltbook...")
+    result = subprocess.run(['python3', 'moltbook_scanner.py'], 
+                           capture_output=True, encoding='utf-8', errors='replace', timeout=60)
+
+    lines = result.stdout.split('\n')
+    for i, line in enumerate(lines):
+        if line.strip().startswith('**') and re.match(r'\*\*\d+\.', line.strip()):
+            title = line.strip().replace('**', '')
+            title = re.sub(r'^\d+\.\s*', '', title)
+            url = score = ""
+
+            for j in range(1, 6):
+                if i+j < len(lines):
+                    if 'https://moltbook.com/post/' in lines[i+j]:
+                        url = lines[i+j].strip().replace('- ', '')
+                    if 'Score:' in lines[i+j]:
+                        m = re.search(r'Score: (\d+)', lines[i+j])
+                        score = m.group(1) if m else ""
+
+            if url:
+                all_items.append({
+                    'platform': 'Moltbook',
+                    'title': title,
+                    'summary': f"Score: {score}",
+                    'url': url
+                })
+
+    print(f"  Found {len([i for i in all_items if i['platform']=='Moltbook'])} Moltbook items")
+
+    # Run YouTube scanner
+    print("🎥 Scanning YouTube...")
+    result = subprocess.run(['python3', 'youtube_ai_monitor.py'], 
+                           capture_output=True, encoding='utf-8', errors='replace', timeout=60)
+
+    lines = result.stdout.split('\n')
+    for i, line in enumerate(lines):
+        if line.strip().startswith('**') and re.match(r'\*\*\d+\.', line.strip()):
+            title = line.strip().replace('**', '')
+            title = re.sub(r'^\d+\.\s*', '', title)
+            url = channel = ""
+
+            for j in range(1, 4):
+                if i+j < len(lines):
+                    if 'https://www.youtube.com' in lines[i+j]:
+                        url = lines[i+j].strip().replace('- ', '')
+                    if 'Channel:' in lines[i+j]:
+                        channel = lines[i+j].split('Channel: ')[1].strip()
+
+            if url:
+                all_items.append({
+                    'platform': 'YouTube',
+                    'title': title,
+                    'summary': f"Channel: {channel}",
+                    'url': url
+                })
+
+    print(f"  Found {len([i for i in all_items if i['platform']=='YouTube'])} YouTube items")
+
+    # Run RSS scanner
+    print("📰 Scanning RSS...")
+    result = subprocess.run(['python3', 'rss_news_scanner.py'], 
+                           capture_output=True, encoding='utf-8', errors='replace', timeout=60)
+
+    lines = result.stdout.split('\n')
+    for i, line in enumerate(lines):
+        if line.strip().startswith('**') and re.match(r'\*\*\d+\.', line.strip()):
+            title = line.strip().replace('**', '')
+            title = re.sub(r'^\d+\.\s*', '', title)
+            url = source = ""
+
+            for j in range(1, 4):
+                if i+j < len(lines):
+                    if 'Link: https://' in lines[i+j]:
+                        url = lines[i+j].split('Link: ')[1].strip()
+                    elif '- https://' in lines[i+j]:
+                        url = lines[i+j].split('- ')[1].strip()
+                    if '- ' in lines[i+j] and '•' in lines[i+j]:
+                        source = lines[i+j].split('- ')[1].split('•')[0].strip()
+
+            if url:
+                all_items.append({
+                    'platform': 'RSS',
+                    'title': title,
+                    'summary': source,
+                    'url': url
+                })
+
+    print(f"  Found {len([i for i in all_items if i['platform']=='RSS'])} RSS items")
+
+    return all_items
+
+
+def items_from_results(results):
+    """Build the same item list from run_full_digest's in-memory results"""
+    all_items = []
+
+    for post in results.get('reddit', {}).get('posts', []):
+        all_items.append({
+            'platform': 'Reddit',
+            'title': post.get('title', ''),
+            'summary': (f"r/{post.get('subreddit', '')} • Engagement: {post.get('engagement_score', 0)} "
+                        f"(↑{post.get('score', 0)} upvotes + 💬{post.get('num_comments', 0)} comments)"),
+            'url': post.get('url', '')
+        })
+
+    for post in results.get('moltbook', {}).get('posts', []):
+        all_items.append({
+            'platform': 'Moltbook',
+            'title': post.get('title', ''),
+            'summary': f"Score: {post.get('score', '')}",
+            'url': post.get('url', '')
+        })
+
+    for video in results.get('youtube', {}).get('videos', []):
+        all_items.append({
+            'platform': 'YouTube',
+            'title': video.get('title', ''),
+            'summary': f"Channel: {video.get('channel_name', '')}",
+            'url': video.get('url', '')
+        })
+
+    for article in results.get('rss', {}).get('articles', []):
+        all_items.append({
+            'platform': 'RSS',
+            'title': article.get('title', ''),
+            'summary': article.get('source', ''),
+            'url': article.get('url', '')
+        })
+
+    return [item for item in all_items if item['url']]
+
+
+def build_database(results=None):
+    """
+    Save Database/complete_with_titles.json and .html
+
+    Args:
+        results: Platform results from run_full_digest; when omitted the
+            scanners are run here instead
+    """
+    all_items = scan_items() if results is None else items_from_results(results)
+
+    print(f"\n✅ Total: {len(all_items)} items with titles/summaries")
+
+    # Save database
+    database = {
+        'date': datetime.now().isoformat(),
+        'total': len(all_items),
+        'items': all_items
+    }
+
+    os.makedirs('Database', exist_ok=True)
+    with open('Database/complete_with_titles.json', 'w') as f:
+        json.dump(database, f, indent=2)
+
+    print(f"✅ Saved: Database/complete_with_titles.json")
+
+    # Generate HTML
+    html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -239,32 +291,45 @@ html = f"""<!DOCTYPE html>
         <p>Generated: {datetime.now().strftime('%Y-%m-%d %I:%M %p PST')}</p>
 """
 
-# Group by platform
-platforms = {}
-for item in all_items:
-    plat = item['platform']
-    if plat not in platforms:
-        platforms[plat] = []
-    platforms[plat].append(item)
-
-for platform in ['Reddit', 'Moltbook', 'YouTube', 'RSS']:
-    if platform in platforms:
-        items = platforms[platform]
-        html += f'<h2>{platform} ({len(items)} items)</h2>'
-        for item in items:
-            html += f'''<div class="item">
+    # Group by platform
+    platforms = {}
+    for item in all_items:
+        plat = item['platform']
+        if plat not in platforms:
+            platforms[plat] = []
+        platforms[plat].append(item)
+
+    for platform in ['Reddit', 'Moltbook', 'YouTube', 'RSS']:
+        if platform in platforms:
+            items = platforms[platform]
+            html += f'<h2>{platform} ({len(items)} items)</h2>'
+            for item in items:
+                html += f'''<div class="item">
                 <span class="platform {platform}">{platform}</span>
                 <div class="item-title">{item['title']}</div>
                 <div class="item-summary">{item.get('summary', '')}</div>
                 <a class="item-url" href="{item['url']}" target="_blank">{item['url']}</a>
             </div>'''
 
-html += """
+    html += """
     </div>
 </body>
 </html>"""
 
-with open('Database/complete_with_titles.html', 'w', encoding='utf-8') as f:
-    f.write(html)
+    with open('Database/complete_with_titles.html', 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    print(f"✅ Saved: Database/complete_with_titles.html")
+
+
+if __name__ == "__main__":
+    # Fix emoji output on Windows terminals
+    if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-print(f"✅ Saved: Database/complete_with_titles.html")
+    # --stdin: take a run_full_digest database (as in Database/complete_<date>.json)
+    # on stdin instead of running the scanners again
+    if '--stdin' in sys.argv:
+        build_database(json.loads(sys.stdin.buffer.read())['results'])
+    else:
+        build_database()
@@ -7,14 +7,15 @@ import requests
 from reddit_json_client import RedditJSONClient
 
 class HealthTracker:
-    def __init__(self, bearer_token):
+    def __init__(self, bearer_token, session=None):
+        self.session = session or requests.Session()
         self.bearer_token = bearer_token
         self.base_url = "https://api.twitter.com/2"
         self.headers = {
             "Authorization": f"Bearer {bearer_token}",
             "User-Agent": "BishopDailyDossier/1.0"
         }
-        self.reddit_client = RedditJSONClient()
+        self.reddit_client = RedditJSONClient(session=self.session)
         
         # Health topics to track
         self.topics = {
@@ -59,7 +60,7 @@ class HealthTracker:
             try:
                 # Get user ID
                 user_endpoint = f"{self.base_url}/users/by/username/{username}"
-                user_response = requests.get(user_endpoint, headers=self.headers, timeout=10)
+                user_response = self.session.get(user_endpoint, headers=self.headers, timeout=10)
                 
                 if user_response.status_code != 200:
                     print("❌")
@@ -75,7 +76,7 @@ class HealthTracker:
                     "exclude": "retweets,replies"
                 }
                 
-                tweets_response = requests.get(tweets_endpoint, headers=self.headers, params=params, timeout=10)
+                tweets_response = self.session.get(tweets_endpoint, headers=self.headers, params=params, timeout=10)
                 
                 if tweets_response.status_code != 200:
                     print("❌")
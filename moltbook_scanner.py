@@ -10,7 +10,8 @@ from datetime import datetime
 from pathlib import Path
 
 class MoltbookScanner:
-    def __init__(self):
+    def __init__(self, session=None):
+        self.session = session or requests.Session()
         self.base_url = "https://www.moltbook.com/api/v1"
         self.credentials_path = Path.home() / ".config/moltbook/credentials.json"
         self.api_key = None
@@ -57,7 +58,7 @@ class MoltbookScanner:
                 'User-Agent': f'MoltbookPatrol/1.0 ({self.agent_name})'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 feed_url,
                 headers=headers,
                 params={'sort': 'hot', 'limit': limit},
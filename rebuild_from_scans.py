@@ -9,12 +9,15 @@ from datetime import datetime
 
 all_items = []
 
+# Underscores and dashes in URL slugs become spaces, in one pass
+_SLUG_TRANS = str.maketrans('_-', '  ')
+
 def parse_title_from_url(url):
     if 'reddit.com' in url:
         match = re.search(r'/([^/]+)/?$', url.rstrip('/'))
         if match:
             slug = match.group(1)
-            return slug.replace('_', ' ').replace('-', ' ').title()
+            return slug.translate(_SLUG_TRANS).title()
     elif 'youtube.com' in url or 'youtu.be' in url:
         return "YouTube Video"
     elif 'twitter.com' in url or 'x.com' in url:
@@ -25,7 +28,7 @@ def parse_title_from_url(url):
         match = re.search(r'/([^/]+)/?$', url.rstrip('/'))
         if match:
             slug = match.group(1)
-            return slug.replace('_', ' ').replace('-', ' ').title()
+            return slug.translate(_SLUG_TRANS).title()
     return "Link"
 
 # Parse Reddit
@@ -8,7 +8,9 @@ import time
 from datetime import datetime
 
 class RedditJSONClient:
-    def __init__(self):
+    def __init__(self, session=None):
+        # Shared session keeps connections to reddit.com alive between calls
+        self.session = session or requests.Session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -21,7 +23,7 @@ class RedditJSONClient:
         url = f"https://www.reddit.com/r/{subreddit}/{sort}.json?limit={limit}"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             data = response.json()
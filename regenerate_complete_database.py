@@ -3,9 +3,157 @@
 Regenerate complete database with ALL platforms, titles, engagement, and logo fallbacks
 """
 
+import hashlib
 import json
+import os
 import re
 import shutil
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from utils.file_utils import WRITE_BUFFER_SIZE, atomic_write_text, snapshot_file
+
+# Shared stylesheet, written once to an assets/ folder next to each page
+CSS = """body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    background: #1d1d1f;
+    color: #f5f5f7;
+    padding: 20px;
+    line-height: 1.6;
+}
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: #2d2d2f;
+    border-radius: 12px;
+    padding: 40px;
+}
+h1 {
+    color: #0a84ff;
+    font-size: 48px;
+    margin-bottom: 10px;
+}
+.stats {
+    font-size: 24px;
+    color: #30d158;
+    margin: 20px 0;
+}
+h2 {
+    color: #0a84ff;
+    font-size: 32px;
+    margin-top: 40px;
+    border-left: 4px solid #0a84ff;
+    padding-left: 20px;
+}
+.item {
+    background: #1d1d1f;
+    padding: 20px;
+    margin: 15px 0;
+    border-radius: 8px;
+    border-left: 3px solid #0a84ff;
+    display: flex;
+    gap: 20px;
+    align-items: flex-start;
+}
+.item-content {
+    flex: 1;
+    min-width: 0;
+}
+.item-engagement {
+    display: flex;
+    gap: 15px;
+    margin: 12px 0;
+    font-size: 14px;
+    color: #a1a1a6;
+}
+.engagement-item {
+    display: flex;
+    align-items: center;
+    gap: 5px;
+}
+.engagement-item svg {
+    width: 16px;
+    height: 16px;
+    fill: #a1a1a6;
+}
+.item-preview {
+    flex-shrink: 0;
+    width: 200px;
+    height: 150px;
+    border-radius: 8px;
+    overflow: hidden;
+    background: #1d1d1f;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    border: 1px solid #424245;
+}
+.item-preview img {
+    width: 80px;
+    height: 80px;
+    object-fit: contain;
+    opacity: 0.6;
+}
+.item-title {
+    font-size: 20px;
+    font-weight: 700;
+    color: #0a84ff;
+    margin-bottom: 8px;
+}
+.item-meta {
+    color: #a1a1a6;
+    font-size: 14px;
+    margin-bottom: 8px;
+}
+.item-url {
+    color: #0a84ff;
+    text-decoration: none;
+    word-break: break-all;
+    font-size: 13px;
+    display: block;
+    margin-top: 8px;
+}
+.item-url:hover {
+    text-decoration: underline;
+}
+.platform {
+    display: inline-block;
+    padding: 4px 12px;
+    border-radius: 12px;
+    font-size: 12px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+.reddit { background: #FF4500; }
+.twitter { background: #1DA1F2; }
+.youtube { background: #FF0000; }
+.moltbook { background: #9B59B6; }
+.health { background: #30d158; }
+.rss { background: #FFA500; }
+
+@media (max-width: 768px) {
+    .item {
+        flex-direction: column;
+    }
+    .item-preview {
+        width: 100%;
+        height: 200px;
+    }
+}
+"""
+
+def write_stylesheet(css_path):
+    """Write CSS to css_path unless the file already holds the same content"""
+    if os.path.exists(css_path):
+        with open(css_path, 'r', encoding='utf-8') as f:
+            if f.read() == CSS:
+                return
+    os.makedirs(os.path.dirname(css_path), exist_ok=True)
+    atomic_write_text(css_path, CSS)
+
+# Underscores and dashes in URL slugs become spaces, in one pass
+_SLUG_TRANS = str.maketrans('_-', '  ')
 
 def parse_title_from_url(url):
     """Extract title from URL slug"""
@@ -13,7 +161,7 @@ def parse_title_from_url(url):
         match = re.search(r'/([^/]+)/?$', url.rstrip('/'))
         if match:
             slug = match.group(1)
-            title = slug.replace('_', ' ').replace('-', ' ')
+            title = slug.translate(_SLUG_TRANS)
             return title.title()
     elif 'youtube.com' in url or 'youtu.be' in url:
         return "YouTube Video"
@@ -25,10 +173,49 @@ def parse_title_from_url(url):
         match = re.search(r'/([^/]+)/?$', url.rstrip('/'))
         if match:
             slug = match.group(1)
-            title = slug.replace('_', ' ').replace('-', ' ')
+            title = slug.translate(_SLUG_TRANS)
             return title.title()
     return "Link"
 
+def parse_reddit_engagement(path):
+    """Parse upvotes/comments per Reddit URL from a scan output file"""
+    engagement = {}
+    try:
+        with open(path, 'r') as f:
+            reddit_text = f.read()
+        entries = reddit_text.split('\n\n')
+        for entry in entries:
+            url_match = re.search(r'🔗 (https://www\.reddit\.com[^\s]+)', entry)
+            engagement_match = re.search(r'📊 Engagement: (\d+) \(↑(\d+) upvotes \+ 💬(\d+) comments\)', entry)
+            if url_match and engagement_match:
+                url = url_match.group(1)
+                engagement[url] = {
+                    'upvotes': int(engagement_match.group(2)),
+                    'comments': int(engagement_match.group(3))
+                }
+        print(f"  ✅ Found engagement for {len(engagement)} Reddit posts")
+    except Exception as e:
+        print(f"  ⚠️  Reddit engagement: {e}")
+    return engagement
+
+def parse_moltbook_scores(path):
+    """Parse score per Moltbook URL from a scan output file"""
+    scores = {}
+    try:
+        with open(path, 'r') as f:
+            moltbook_text = f.read()
+        entries = moltbook_text.split('\n\n')
+        for entry in entries:
+            url_match = re.search(r'(https://moltbook\.com/post/[^\s]+)', entry)
+            score_match = re.search(r'Score: (\d+)', entry)
+            if url_match and score_match:
+                url = url_match.group(1)
+                scores[url] = {'score': int(score_match.group(1))}
+        print(f"  ✅ Found scores for Moltbook posts")
+    except Exception as e:
+        print(f"  ⚠️  Moltbook scores: {e}")
+    return scores
+
 # Load the restored complete database
 print("📂 Loading complete database with all 704 items...")
 with open('Database/complete_2026-02-07_backup.json', 'r') as f:
@@ -46,62 +233,64 @@ for item in data['items']:
 
 print(f"✅ Added titles to all items")
 
-# Parse engagement data from scan results
+# Parse engagement data from scan results (the two files are independent)
 print("\n📊 Adding engagement data...")
-engagement_map = {}
-
-# Reddit engagement
-try:
-    with open('/tmp/reddit.txt', 'r') as f:
-        reddit_text = f.read()
-    entries = reddit_text.split('\n\n')
-    for entry in entries:
-        url_match = re.search(r'🔗 (https://www\.reddit\.com[^\s]+)', entry)
-        engagement_match = re.search(r'📊 Engagement: (\d+) \(↑(\d+) upvotes \+ 💬(\d+) comments\)', entry)
-        if url_match and engagement_match:
-            url = url_match.group(1)
-            engagement_map[url] = {
-                'upvotes': int(engagement_match.group(2)),
-                'comments': int(engagement_match.group(3))
-            }
-    print(f"  ✅ Found engagement for {len(engagement_map)} Reddit posts")
-except Exception as e:
-    print(f"  ⚠️  Reddit engagement: {e}")
-
-# Moltbook scores
-try:
-    with open('/tmp/moltbook.txt', 'r') as f:
-        moltbook_text = f.read()
-    entries = moltbook_text.split('\n\n')
-    for entry in entries:
-        url_match = re.search(r'(https://moltbook\.com/post/[^\s]+)', entry)
-        score_match = re.search(r'Score: (\d+)', entry)
-        if url_match and score_match:
-            url = url_match.group(1)
-            engagement_map[url] = {'score': int(score_match.group(1))}
-    print(f"  ✅ Found scores for Moltbook posts")
-except Exception as e:
-    print(f"  ⚠️  Moltbook scores: {e}")
-
-# Apply engagement data
-updated = 0
+with ThreadPoolExecutor(max_workers=2) as executor:
+    reddit_future = executor.submit(parse_reddit_engagement, '/tmp/reddit.txt')
+    moltbook_future = executor.submit(parse_moltbook_scores, '/tmp/moltbook.txt')
+    engagement_map = {**reddit_future.result(), **moltbook_future.result()}
+
+# Apply engagement data - walk the (usually much smaller) engagement map
+# against a URL index rather than scanning every item
+items_by_url = defaultdict(list)
 for item in data['items']:
-    url = item.get('url', '')
-    if url in engagement_map:
-        item.update(engagement_map[url])
+    if 'url' in item:
+        items_by_url[item['url']].append(item)
+
+updated = 0
+for url, engagement in engagement_map.items():
+    for item in items_by_url.get(url, ()):
+        item.update(engagement)
         updated += 1
 
 print(f"✅ Added engagement to {updated} items")
 
+# Skip regeneration when neither the data nor this generator changed since the
+# last run, and every output is still the one that run wrote (the add_*.py
+# scripts rewrite these files in place, which makes them newer than the hash)
+hash_file = 'Database/complete_2026-02-07.hash'
+output_files = [
+    'Database/complete_2026-02-07.json',
+    'Database/all_items_latest.html',
+    'Database/assets/dossier.css',
+    'Daily/2026-02-07-10PM/all_items.html',
+    'Daily/2026-02-07-10PM/assets/dossier.css',
+]
+hasher = hashlib.blake2b(json.dumps(data, sort_keys=True).encode('utf-8'), digest_size=16)
+with open(__file__, 'rb') as f:
+    hasher.update(f.read())
+content_hash = hasher.hexdigest()
+if os.path.exists(hash_file):
+    hash_mtime = os.path.getmtime(hash_file)
+    outputs_current = all(
+        os.path.exists(path) and os.path.getmtime(path) <= hash_mtime
+        for path in output_files
+    )
+    with open(hash_file, 'r') as f:
+        if outputs_current and f.read().strip() == content_hash:
+            print("\n✅ No changes since last run - skipping JSON/HTML regeneration")
+            sys.exit(0)
+
 # Save updated database
-with open('Database/complete_2026-02-07.json', 'w') as f:
-    json.dump(data, f, indent=2)
+atomic_write_text('Database/complete_2026-02-07.json', json.dumps(data, indent=2))
 
 print(f"\n💾 Saved: Database/complete_2026-02-07.json")
 
 # Now regenerate HTML with all platforms
 print("\n🎨 Generating HTML with all platforms...")
 
+write_stylesheet('Database/assets/dossier.css')
+
 platform_logos = {
     'reddit': 'https://www.redditstatic.com/desktop2x/img/favicon/favicon-96x96.png',
     'twitter': 'https://abs.twimg.com/icons/apple-touch-icon-192x192.png',
@@ -126,134 +315,7 @@ html = f"""<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Complete Database - {data['total']} Items</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: #1d1d1f;
-            color: #f5f5f7;
-            padding: 20px;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #2d2d2f;
-            border-radius: 12px;
-            padding: 40px;
-        }}
-        h1 {{
-            color: #0a84ff;
-            font-size: 48px;
-            margin-bottom: 10px;
-        }}
-        .stats {{
-            font-size: 24px;
-            color: #30d158;
-            margin: 20px 0;
-        }}
-        h2 {{
-            color: #0a84ff;
-            font-size: 32px;
-            margin-top: 40px;
-            border-left: 4px solid #0a84ff;
-            padding-left: 20px;
-        }}
-        .item {{
-            background: #1d1d1f;
-            padding: 20px;
-            margin: 15px 0;
-            border-radius: 8px;
-            border-left: 3px solid #0a84ff;
-            display: flex;
-            gap: 20px;
-            align-items: flex-start;
-        }}
-        .item-content {{
-            flex: 1;
-            min-width: 0;
-        }}
-        .item-engagement {{
-            display: flex;
-            gap: 15px;
-            margin: 12px 0;
-            font-size: 14px;
-            color: #a1a1a6;
-        }}
-        .engagement-item {{
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        .engagement-item svg {{
-            width: 16px;
-            height: 16px;
-            fill: #a1a1a6;
-        }}
-        .item-preview {{
-            flex-shrink: 0;
-            width: 200px;
-            height: 150px;
-            border-radius: 8px;
-            overflow: hidden;
-            background: #1d1d1f;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border: 1px solid #424245;
-        }}
-        .item-preview img {{
-            width: 80px;
-            height: 80px;
-            object-fit: contain;
-            opacity: 0.6;
-        }}
-        .item-title {{
-            font-size: 20px;
-            font-weight: 700;
-            color: #0a84ff;
-            margin-bottom: 8px;
-        }}
-        .item-meta {{
-            color: #a1a1a6;
-            font-size: 14px;
-            margin-bottom: 8px;
-        }}
-        .item-url {{
-            color: #0a84ff;
-            text-decoration: none;
-            word-break: break-all;
-            font-size: 13px;
-            display: block;
-            margin-top: 8px;
-        }}
-        .item-url:hover {{
-            text-decoration: underline;
-        }}
-        .platform {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .reddit {{ background: #FF4500; }}
-        .twitter {{ background: #1DA1F2; }}
-        .youtube {{ background: #FF0000; }}
-        .moltbook {{ background: #9B59B6; }}
-        .health {{ background: #30d158; }}
-        .rss {{ background: #FFA500; }}
-        
-        @media (max-width: 768px) {{
-            .item {{
-                flex-direction: column;
-            }}
-            .item-preview {{
-                width: 100%;
-                height: 200px;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="assets/dossier.css">
 </head>
 <body>
     <div class="container">
@@ -266,12 +328,9 @@ upvote_icon = '<svg viewBox="0 0 24 24"><path d="M12 4l-8 8h5v8h6v-8h5z"/></svg>
 comment_icon = '<svg viewBox="0 0 24 24"><path d="M20 2H4c-1.1 0-2 .9-2 2v12c0 1.1.9 2 2 2h14l4 4V4c0-1.1-.9-2-2-2zm-2 12H6v-2h12v2zm0-3H6V9h12v2zm0-3H6V6h12v2z"/></svg>'
 
 # Group by platform
-grouped = {}
+grouped = defaultdict(list)
 for item in data['items']:
-    platform = item.get('platform', 'unknown')
-    if platform not in grouped:
-        grouped[platform] = []
-    grouped[platform].append(item)
+    grouped[item.get('platform', 'unknown')].append(item)
 
 for platform_key in ['reddit', 'twitter', 'youtube', 'moltbook', 'health', 'rss']:
     if platform_key not in grouped:
@@ -284,8 +343,9 @@ for platform_key in ['reddit', 'twitter', 'youtube', 'moltbook', 'health', 'rss'
     html += f'<h2>{platform_info["name"]} ({len(items)} items)</h2>'
     
     for item in items:
-        title = item.get('title', 'Untitled')
-        url = item.get('url', '')
+        # Escape scraped text once here so every use below is HTML-safe
+        title = escape(item.get('title', 'Untitled'))
+        url = escape(item.get('url', ''))
         platform_class = platform_info['color']
         
         # Metadata
@@ -296,7 +356,7 @@ for platform_key in ['reddit', 'twitter', 'youtube', 'moltbook', 'health', 'rss'
             meta.append(item['channel'])
         if 'source' in item:
             meta.append(item['source'])
-        meta_str = ' • '.join(meta) if meta else ''
+        meta_str = escape(' • '.join(meta)) if meta else ''
         
         # Engagement
         upvotes = item.get('upvotes', 0)
@@ -331,11 +391,17 @@ html += """
 </body>
 </html>"""
 
-with open('Database/all_items_latest.html', 'w') as f:
+with open('Database/all_items_latest.html', 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
     f.write(html)
 
-# Update Daily folder
+# Update Daily folder (the page links assets/dossier.css relative to itself)
 shutil.copy('Database/all_items_latest.html', 'Daily/2026-02-07-10PM/all_items.html')
+os.makedirs('Daily/2026-02-07-10PM/assets', exist_ok=True)
+snapshot_file('Database/assets/dossier.css', 'Daily/2026-02-07-10PM/assets/dossier.css')
+
+# Record the hash only once every output has been written
+with open(hash_file, 'w') as f:
+    f.write(content_hash)
 
 print(f"✅ Generated HTML with ALL 6 platforms")
 print(f"✅ Updated Daily/2026-02-07-10PM/all_items.html")
@@ -16,7 +16,8 @@ daily_folder = f'Daily/{date_str}-{time_str}'
 os.makedirs(daily_folder, exist_ok=True)
 print(f"✅ Created: {daily_folder}/")
 
-# Move/copy today's complete database there
+# Copy today's complete database there (real copies, not hardlinks: the
+# add_*.py enrichment scripts rewrite these files in place)
 source_html = 'Database/all_items_2026-02-07.html'
 source_json = 'Database/complete_2026-02-07.json'
 
@@ -30,7 +31,7 @@ if os.path.exists(source_json):
     shutil.copy(source_json, dest_json)
     print(f"✅ Copied: {dest_json}")
 
-# Also copy the highlights digest
+# Also copy the highlights digest (a real copy: dossier.html is edited in place)
 if os.path.exists('dossier.html'):
     dest_digest = f'{daily_folder}/digest.html'
     shutil.copy('dossier.html', dest_digest)
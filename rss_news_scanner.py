@@ -9,11 +9,14 @@ import json
 import os
 from datetime import datetime, timedelta
 from typing import List, Dict
+from utils.file_utils import atomic_write_text
 
 class RSSNewsScanner:
     def __init__(self):
         self.feeds_file = "rss_news_feeds.json"
+        self.cache_file = ".rss_cache.json"
         self.load_feeds()
+        self.load_cache()
         
     def load_feeds(self):
         """Load RSS feeds from JSON file"""
@@ -23,40 +26,83 @@ class RSSNewsScanner:
         else:
             self.feeds = {"ai_news": [], "marketing": [], "health": []}
     
+    def load_cache(self):
+        """Load per-feed ETag/Last-Modified headers and articles from the last scan"""
+        self.cache = {}
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError):
+                self.cache = {}
+    
+    def save_cache(self):
+        """Persist per-feed ETag/Last-Modified headers and articles for the next scan"""
+        try:
+            atomic_write_text(self.cache_file, json.dumps(self.cache, indent=2))
+        except OSError as e:
+            print(f"Error saving feed cache: {str(e)}")
+    
     def fetch_feed(self, feed_url: str, hours_back: int = 24) -> List[Dict]:
         """Fetch articles from an RSS feed"""
         try:
-            feed = feedparser.parse(feed_url)
-            cutoff_time = datetime.now() - timedelta(hours=hours_back)
+            now = datetime.now()
+            cutoff_ts = (now - timedelta(hours=hours_back)).timestamp()
             
-            articles = []
-            for entry in feed.entries[:20]:  # Limit to 20 most recent
-                # Parse published date
-                try:
-                    if hasattr(entry, 'published_parsed'):
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, 'updated_parsed'):
-                        pub_date = datetime(*entry.updated_parsed[:6])
-                    else:
-                        pub_date = datetime.now()
-                except:
-                    pub_date = datetime.now()
-                
-                if pub_date > cutoff_time:
-                    article = {
+            # Conditional GET: unchanged feeds answer 304 with an empty body, so
+            # only send validators when the articles they stand for were kept
+            cached = self.cache.get(feed_url, {})
+            if 'articles' in cached and 'timestamps' in cached:
+                feed = feedparser.parse(feed_url, etag=cached.get('etag'), modified=cached.get('modified'))
+            else:
+                feed = feedparser.parse(feed_url)
+            
+            if getattr(feed, 'status', None) == 304:
+                all_articles, timestamps = cached['articles'], cached['timestamps']
+            else:
+                # timestamps[i] is all_articles[i]'s publish time, kept as a float
+                # so cached articles are filtered without re-parsing their dates
+                all_articles, timestamps = [], []
+                for entry in feed.entries[:20]:  # Limit to 20 most recent
+                    # Parse published date
+                    try:
+                        if hasattr(entry, 'published_parsed'):
+                            pub_date = datetime(*entry.published_parsed[:6])
+                        elif hasattr(entry, 'updated_parsed'):
+                            pub_date = datetime(*entry.updated_parsed[:6])
+                        else:
+                            pub_date = now
+                    except:
+                        pub_date = now
+                    
+                    all_articles.append({
                         'title': entry.title if hasattr(entry, 'title') else 'Untitled',
                         'url': entry.link if hasattr(entry, 'link') else '',
                         'published': pub_date.isoformat(),
                         'summary': entry.summary if hasattr(entry, 'summary') else ''
+                    })
+                    timestamps.append(pub_date.timestamp())
+                
+                if getattr(feed, 'etag', None) or getattr(feed, 'modified', None):
+                    self.cache[feed_url] = {
+                        'etag': getattr(feed, 'etag', None),
+                        'modified': getattr(feed, 'modified', None),
+                        'articles': all_articles,
+                        'timestamps': timestamps
                     }
-                    articles.append(article)
-            
-            return articles
+                else:
+                    self.cache.pop(feed_url, None)
             
+            # Copies, since callers tag articles with their source and category
+            return [
+                dict(article) for article, published_ts in zip(all_articles, timestamps)
+                if published_ts > cutoff_ts
+            ]
+        
         except Exception as e:
             print(f"Error fetching {feed_url}: {str(e)}")
             return []
-    
+
     def scan_all_feeds(self, hours_back: int = 24) -> Dict[str, List[Dict]]:
         """Scan all configured feeds"""
         results = {}
@@ -80,6 +126,8 @@ class RSSNewsScanner:
             
             results[category] = category_articles
         
+        self.save_cache()
+        
         return results
     
     def format_digest(self, results: Dict[str, List[Dict]]) -> str:
@@ -104,12 +152,13 @@ class RSSNewsScanner:
                 categories[cat] = []
             categories[cat].append(article)
         
+        now = datetime.now()
         for category, articles in sorted(categories.items()):
             digest += f"\n## {category} ({len(articles)})\n\n"
             
             for article in articles[:10]:  # Top 10 per category
                 pub_date = datetime.fromisoformat(article['published'])
-                hours_ago = int((datetime.now() - pub_date).total_seconds() / 3600)
+                hours_ago = int((now - pub_date).total_seconds() / 3600)
                 
                 digest += f"**{article['title']}**\n"
                 digest += f"- Source: {article['source']}\n"
@@ -6,13 +6,23 @@ No subprocess issues - direct imports and execution
 
 import sys
 import os
+import asyncio
 import shutil
-import subprocess
 import json
 import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Handle encoding for Task Scheduler (no console attached)
 # Force UTF-8 to avoid emoji encoding errors
@@ -26,17 +36,174 @@ if hasattr(sys.stdout, 'buffer'):
 # Load environment variables from .env file
 load_dotenv(Path(__file__).parent / '.env')
 
-# Import all scanners
-from reddit_json_client import RedditJSONClient
-from twitter_nitter_scraper import TwitterNitterScraper
-from youtube_ai_monitor import YouTubeAIMonitor
-from health_tracker import HealthTracker
-from moltbook_scanner import MoltbookScanner
-from rss_news_scanner import RSSNewsScanner
-from html_generator import DigestHTMLGenerator
+# Scanners are imported inside their scan_* function: each pulls in its own
+# dependencies, and a broken import should only fail that one platform
+from add_footer_links import add_footer
+from complete_with_titles import build_database
+from utils.file_utils import atomic_open, atomic_write_bytes, atomic_write_text
+from utils.scan_cache import ScanCache
+
+def create_http_session():
+    """Build the keep-alive session shared by every HTTP-based scanner"""
+    session = requests.Session()
+    # Pool sized for the parallel subreddit fetches plus the other scanners
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+HTTP_SESSION = create_http_session()
+
+# Sources that rarely change within the hour are reused between scheduled runs
+SCAN_CACHE = ScanCache('.scan_cache.json')
+REDDIT_CACHE_TTL = 10 * 60
+MOLTBOOK_CACHE_TTL = 15 * 60
+RSS_CACHE_TTL = 20 * 60
+YOUTUBE_CACHE_TTL = 30 * 60
+
+def _json_default(obj):
+    """Serialize tuple subclasses (e.g. feedparser's struct_time) like stdlib json does"""
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def scan_reddit():
+    from reddit_json_client import RedditJSONClient
+    reddit = RedditJSONClient(session=HTTP_SESSION)
+    subreddits = ['entrepreneur', 'smallbusiness', 'startups', 'ecommerce',
+                  'freelance', 'digitalmarketing', 'SideProject', 'passive_income']
+    reddit_posts = []
+    # One blocking request per subreddit - fetch them all at once, keep list order
+    with ThreadPoolExecutor(max_workers=len(subreddits)) as executor:
+        futures = [
+            executor.submit(SCAN_CACHE.get_or_scan, f'reddit:{sub}', REDDIT_CACHE_TTL,
+                            lambda sub=sub: reddit.fetch_posts(sub, limit=25))
+            for sub in subreddits
+        ]
+        for future in futures:
+            try:
+                reddit_posts.extend(future.result())
+            except Exception:
+                pass
+    return {'count': len(reddit_posts), 'posts': reddit_posts}
+
+def scan_twitter():
+    from twitter_nitter_scraper import TwitterNitterScraper
+    # Using Nitter scraping (free, no API needed)
+    twitter = TwitterNitterScraper(session=HTTP_SESSION)
+    twitter_updates = twitter.scan_builders(max_accounts=20)
+    return {'count': len(twitter_updates), 'posts': twitter_updates}
+
+def scan_youtube():
+    from youtube_ai_monitor import YouTubeAIMonitor
+    youtube = YouTubeAIMonitor()
+    youtube_videos = SCAN_CACHE.get_or_scan('youtube:all_channels', YOUTUBE_CACHE_TTL,
+                                            youtube.scan_all_channels)
+    # Flatten dict to list
+    all_videos = []
+    for channel_videos in youtube_videos.values():
+        all_videos.extend(channel_videos)
+    return {'count': len(all_videos), 'videos': all_videos}
+
+def scan_moltbook():
+    from moltbook_scanner import MoltbookScanner
+    moltbook = MoltbookScanner(session=HTTP_SESSION)
+    moltbook_posts = SCAN_CACHE.get_or_scan('moltbook:feed', MOLTBOOK_CACHE_TTL,
+                                            lambda: moltbook.scan_feed(limit=100))
+    return {'count': len(moltbook_posts), 'posts': moltbook_posts}
+
+def scan_health():
+    from health_tracker import HealthTracker
+    bearer_token = os.getenv("TWITTER_BEARER_TOKEN", "")
+    if not bearer_token:
+        raise ValueError("No TWITTER_BEARER_TOKEN in .env - skipping")
+    health = HealthTracker(bearer_token, session=HTTP_SESSION)
+    health_posts = health.scan_all()
+    return {'count': len(health_posts), 'posts': health_posts}
+
+def scan_rss():
+    from rss_news_scanner import RSSNewsScanner
+    rss = RSSNewsScanner()
+    rss_articles = SCAN_CACHE.get_or_scan('rss:all_feeds', RSS_CACHE_TTL,
+                                          lambda: rss.scan_all_feeds(hours_back=24))
+    # Flatten
+    all_articles = []
+    for articles in rss_articles.values():
+        all_articles.extend(articles)
+    return {'count': len(all_articles), 'articles': all_articles}
+
+# (key, banner, scanner, items key, found label, failure label)
+PLATFORM_SCANNERS = [
+    ('reddit', "🟠 REDDIT - Business Pain Points", scan_reddit, 'posts', "Reddit leads", "Reddit"),
+    ('twitter', "🔵 TWITTER - Building in Public", scan_twitter, 'posts', "Twitter updates", "Twitter"),
+    ('youtube', "🎥 YOUTUBE - AI Videos", scan_youtube, 'videos', "YouTube videos", "YouTube"),
+    ('moltbook', "🤖 MOLTBOOK - AI Agent Ecosystem", scan_moltbook, 'posts', "Moltbook posts", "Moltbook"),
+    ('health', "🟢 HEALTH - Pritikin & WFPB", scan_health, 'posts', "Health posts", "Health"),
+    ('rss', "📰 RSS NEWS - AI, Marketing, Health News", scan_rss, 'articles', "RSS articles", "RSS News"),
+]
+
+# Platform key -> the results key its items are stored under
+ITEM_KEYS = {entry[0]: entry[3] for entry in PLATFORM_SCANNERS}
+
+# Same characters as html.escape(quote=True), applied in a single pass
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+})
 
-def run_full_digest():
+# Static <style> block of the all-items page - written verbatim, never formatted
+ALL_ITEMS_STYLE = """    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+               background: #1d1d1f; color: #f5f5f7; padding: 20px; }
+        h1 { color: #0a84ff; }
+        h2 { color: #0a84ff; margin-top: 40px; }
+        .count { color: #30d158; font-size: 20px; font-weight: bold; }
+        .item { margin: 20px 0; padding: 15px; background: #2d2d2f; border-radius: 8px; }
+        .platform { display: inline-block; padding: 4px 8px; border-radius: 4px;
+                     font-size: 12px; font-weight: bold; margin-right: 10px; }
+        .reddit { background: #ff4500; }
+        .twitter { background: #1da1f2; }
+        .youtube { background: #ff0000; }
+        .moltbook { background: #8b5cf6; }
+        .health { background: #10b981; }
+        .rss { background: #f59e0b; }
+        a { color: #0a84ff; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+    </style>
+"""
+
+# (CSS class, section label) for the all-items database page, in page order
+ALL_ITEMS_PLATFORMS = [
+    ('reddit', '🟠 Reddit'), ('twitter', '🔵 Twitter'), ('youtube', '🎥 YouTube'),
+    ('moltbook', '🤖 Moltbook'), ('health', '🟢 Health'), ('rss', '📰 RSS')
+]
+
+def dedupe_by_url(items):
+    """Drop repeat items (same post via two subreddits/feeds), keeping the first"""
+    seen = set()
+    unique = []
+    for item in items:
+        url = item.get('url')
+        if url:
+            if url in seen:
+                continue
+            seen.add(url)
+        unique.append(item)
+    return unique
+
+async def scan_all_platforms():
+    """Run every platform scanner concurrently; failures come back as exceptions"""
+    loop = asyncio.get_running_loop()
+    # Scanners are blocking, so each gets its own worker thread
+    with ThreadPoolExecutor(max_workers=len(PLATFORM_SCANNERS)) as executor:
+        tasks = [loop.run_in_executor(executor, entry[2]) for entry in PLATFORM_SCANNERS]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+def run_full_digest(now=None):
     """Run all platforms and generate complete digest"""
+    # One timestamp for the whole run keeps every file name and label in step
+    now = now or datetime.now()
+    date_str = now.strftime('%Y-%m-%d')
     print("=" * 80)
     print("🚀 RUNNING FULL 6-PLATFORM DIGEST")
     print("=" * 80)
@@ -44,90 +211,20 @@ def run_full_digest():
     
     results = {}
     
-    # 1. Reddit
-    print("🟠 REDDIT - Business Pain Points")
-    try:
-        reddit = RedditJSONClient()
-        subreddits = ['entrepreneur', 'smallbusiness', 'startups', 'ecommerce',
-                      'freelance', 'digitalmarketing', 'SideProject', 'passive_income']
-        reddit_posts = []
-        for sub in subreddits:
-            try:
-                posts = reddit.fetch_posts(sub, limit=25)
-                reddit_posts.extend(posts)
-            except Exception:
-                pass
-        results['reddit'] = {'count': len(reddit_posts), 'posts': reddit_posts}
-        print(f"✅ Found {len(reddit_posts)} Reddit leads\n")
-    except Exception as e:
-        print(f"❌ Reddit failed: {e}\n")
-        results['reddit'] = {'count': 0, 'posts': []}
-
-    # 2. Twitter - Using Nitter scraping (free, no API needed)
-    print("🔵 TWITTER - Building in Public")
-    try:
-        twitter = TwitterNitterScraper()
-        twitter_updates = twitter.scan_builders(max_accounts=20)
-        results['twitter'] = {'count': len(twitter_updates), 'posts': twitter_updates}
-        print(f"✅ Found {len(twitter_updates)} Twitter updates\n")
-    except Exception as e:
-        print(f"❌ Twitter failed: {e}\n")
-        results['twitter'] = {'count': 0, 'posts': []}
-    
-    # 3. YouTube
-    print("🎥 YOUTUBE - AI Videos")
-    try:
-        youtube = YouTubeAIMonitor()
-        youtube_videos = youtube.scan_all_channels()
-        # Flatten dict to list
-        all_videos = []
-        for channel_videos in youtube_videos.values():
-            all_videos.extend(channel_videos)
-        results['youtube'] = {'count': len(all_videos), 'videos': all_videos}
-        print(f"✅ Found {len(all_videos)} YouTube videos\n")
-    except Exception as e:
-        print(f"❌ YouTube failed: {e}\n")
-        results['youtube'] = {'count': 0, 'videos': []}
-    
-    # 4. Moltbook
-    print("🤖 MOLTBOOK - AI Agent Ecosystem")
-    try:
-        moltbook = MoltbookScanner()
-        moltbook_posts = moltbook.scan_feed(limit=100)
-        results['moltbook'] = {'count': len(moltbook_posts), 'posts': moltbook_posts}
-        print(f"✅ Found {len(moltbook_posts)} Moltbook posts\n")
-    except Exception as e:
-        print(f"❌ Moltbook failed: {e}\n")
-        results['moltbook'] = {'count': 0, 'posts': []}
+    # Scanners are independent and network-bound, so run them side by side
+    # and report in the usual platform order once they have all finished
+    outcomes = asyncio.run(scan_all_platforms())
+    SCAN_CACHE.save()
     
-    # 5. Health
-    print("🟢 HEALTH - Pritikin & WFPB")
-    try:
-        bearer_token = os.getenv("TWITTER_BEARER_TOKEN", "")
-        if not bearer_token:
-            raise ValueError("No TWITTER_BEARER_TOKEN in .env - skipping")
-        health = HealthTracker(bearer_token)
-        health_posts = health.scan_all()
-        results['health'] = {'count': len(health_posts), 'posts': health_posts}
-        print(f"✅ Found {len(health_posts)} Health posts\n")
-    except Exception as e:
-        print(f"❌ Health failed: {e}\n")
-        results['health'] = {'count': 0, 'posts': []}
-    
-    # 6. RSS News
-    print("📰 RSS NEWS - AI, Marketing, Health News")
-    try:
-        rss = RSSNewsScanner()
-        rss_articles = rss.scan_all_feeds(hours_back=24)
-        # Flatten
-        all_articles = []
-        for articles in rss_articles.values():
-            all_articles.extend(articles)
-        results['rss'] = {'count': len(all_articles), 'articles': all_articles}
-        print(f"✅ Found {len(all_articles)} RSS articles\n")
-    except Exception as e:
-        print(f"❌ RSS News failed: {e}\n")
-        results['rss'] = {'count': 0, 'articles': []}
+    for (key, banner, _, items_key, found_label, failed_label), outcome in zip(PLATFORM_SCANNERS, outcomes):
+        print(banner)
+        if isinstance(outcome, BaseException):
+            print(f"❌ {failed_label} failed: {outcome}\n")
+            results[key] = {'count': 0, items_key: []}
+        else:
+            items = dedupe_by_url(outcome[items_key])
+            results[key] = {'count': len(items), items_key: items}
+            print(f"✅ Found {len(items)} {found_label}\n")
     
     # Calculate total
     total = sum(r['count'] for r in results.values())
@@ -138,87 +235,71 @@ def run_full_digest():
     print()
     
     # Generate combined markdown
-    markdown = generate_combined_markdown(results)
+    highlights = select_highlights(results)
+    markdown = generate_combined_markdown(results, now, highlights)
     
     # Save markdown
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     md_file = f"Exports/full_digest_{timestamp}.md"
     os.makedirs("Exports", exist_ok=True)
-    with open(md_file, 'w', encoding='utf-8') as f:
-        f.write(markdown)
+    atomic_write_text(md_file, markdown)
     print(f"✅ Saved markdown to: {md_file}\n")
 
     # Save dated database files for Daily folder archiving
-    date_str = datetime.now().strftime('%Y-%m-%d')
     os.makedirs("Database", exist_ok=True)
 
     # Save complete JSON database
     database = {
-        'date': datetime.now().isoformat(),
+        'date': now.isoformat(),
         'total_count': total,
         'results': results
     }
     json_file = f'Database/complete_{date_str}.json'
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        atomic_write_bytes(json_file, orjson.dumps(
+            database, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=_json_default))
+    else:
+        atomic_write_text(json_file, json.dumps(database, indent=2, ensure_ascii=False))
     print(f"✅ Saved database JSON: {json_file}")
 
     # Save all_items HTML database
     html_file = f'Database/all_items_{date_str}.html'
-    all_items_html = f"""<!DOCTYPE html>
+    # Stream straight to disk instead of holding the whole page in memory
+    with atomic_open(html_file) as html_out:
+        html_out.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>Complete Database - {date_str}</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-               background: #1d1d1f; color: #f5f5f7; padding: 20px; }}
-        h1 {{ color: #0a84ff; }}
-        h2 {{ color: #0a84ff; margin-top: 40px; }}
-        .count {{ color: #30d158; font-size: 20px; font-weight: bold; }}
-        .item {{ margin: 20px 0; padding: 15px; background: #2d2d2f; border-radius: 8px; }}
-        .platform {{ display: inline-block; padding: 4px 8px; border-radius: 4px;
-                     font-size: 12px; font-weight: bold; margin-right: 10px; }}
-        .reddit {{ background: #ff4500; }}
-        .twitter {{ background: #1da1f2; }}
-        .youtube {{ background: #ff0000; }}
-        .moltbook {{ background: #8b5cf6; }}
-        .health {{ background: #10b981; }}
-        .rss {{ background: #f59e0b; }}
-        a {{ color: #0a84ff; text-decoration: none; }}
-        a:hover {{ text-decoration: underline; }}
-    </style>
-</head>
+""")
+        html_out.write(ALL_ITEMS_STYLE)
+        html_out.write(f"""</head>
 <body>
     <h1>📊 Complete Database - {date_str}</h1>
     <p class="count">Total Items: {total}</p>
-"""
+""")
 
-    # Add all items by platform
-    for platform_name, platform_data in [
-        ('reddit', '🟠 Reddit'), ('twitter', '🔵 Twitter'), ('youtube', '🎥 YouTube'),
-        ('moltbook', '🤖 Moltbook'), ('health', '🟢 Health'), ('rss', '📰 RSS')
-    ]:
-        count = results[platform_name]['count']
-        all_items_html += f"\n<h2>{platform_data} ({count} items)</h2>\n"
-
-        if count > 0:
-            items = results[platform_name].get('posts', results[platform_name].get('videos', results[platform_name].get('articles', [])))
-            for item in items:
-                title = item.get('title', 'Untitled')
-                url = item.get('url', '#')
-                all_items_html += f'<div class="item"><span class="platform {platform_name}">{platform_data}</span><strong>{title}</strong><br><a href="{url}" target="_blank">{url}</a></div>\n'
-        else:
-            all_items_html += "<p>No items found</p>\n"
+        # Add all items by platform
+        for platform_name, platform_data in ALL_ITEMS_PLATFORMS:
+            count = results[platform_name]['count']
+            html_out.write(f"\n<h2>{platform_data} ({count} items)</h2>\n")
 
-    all_items_html += "</body></html>"
+            if count > 0:
+                items = results[platform_name][ITEM_KEYS[platform_name]]
+                for item in items:
+                    # Scraped text goes into markup and an href - escape it once here
+                    title = str(item.get('title', 'Untitled')).translate(_HTML_ESCAPE)
+                    url = str(item.get('url', '#')).translate(_HTML_ESCAPE)
+                    html_out.write(f'<div class="item"><span class="platform {platform_name}">{platform_data}</span><strong>{title}</strong><br><a href="{url}" target="_blank">{url}</a></div>\n')
+            else:
+                html_out.write("<p>No items found</p>\n")
 
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(all_items_html)
+        html_out.write("</body></html>")
     print(f"✅ Saved all items HTML: {html_file}\n")
     
     # Generate HTML
     print("🌐 Generating HTML...")
+    from html_generator import DigestHTMLGenerator
     html_gen = DigestHTMLGenerator()
     
     # Archive old version
@@ -237,97 +318,98 @@ def run_full_digest():
     
     return results
 
-def generate_combined_markdown(results):
+# Per-platform markdown sections:
+# (key, items key, heading, item template, template defaults, items shown, empty message)
+MARKDOWN_SECTIONS = [
+    ('reddit', 'posts', "---\n\n## 🟠 Reddit Business Leads\n\n",
+     "\n**{i}. {title}**\n"
+     "- r/{subreddit} • u/{author}\n"
+     "- Score: {score} (↑{ups} • 💬{num_comments})\n"
+     "- {url}\n",
+     {'title': 'Untitled', 'subreddit': 'unknown', 'author': 'unknown',
+      'score': 0, 'ups': 0, 'num_comments': 0, 'url': ''},
+     10, "\n_No Reddit leads found_\n"),
+    ('twitter', 'posts', "\n---\n\n## 🔵 Twitter Building Updates\n",
+     "\n**{i}. @{username}**\n"
+     "- {text:.200}...\n"
+     "- ❤️{likes} 🔁{retweets} 💬{replies}\n"
+     "- {url}\n",
+     {'username': 'unknown', 'text': '', 'likes': 0, 'retweets': 0, 'replies': 0, 'url': ''},
+     10, "\n_No Twitter updates found_\n"),
+    ('youtube', 'videos', "\n---\n\n## 🎥 YouTube AI Videos\n",
+     "\n**{i}. {title}**\n"
+     "- Channel: {channel_name}\n"
+     "- {url}\n",
+     {'title': 'Untitled', 'channel_name': 'unknown', 'url': ''},
+     10, "\n_No YouTube videos found_\n"),
+    ('moltbook', 'posts', "\n---\n\n## 🤖 Moltbook Agent Builds\n",
+     "\n**{i}. {title}**\n"
+     "- @{author} • Score: {score}\n"
+     "- {url}\n",
+     {'title': 'Untitled', 'author': 'unknown', 'score': 0, 'url': ''},
+     10, "\n_No Moltbook posts found_\n"),
+    ('health', 'posts', "\n---\n\n## 🟢 Health & Wellness\n",
+     "\n**{i}. {title}**\n"
+     "- Source: {source}\n"
+     "- {url}\n",
+     {'title': 'Untitled', 'source': 'unknown', 'url': ''},
+     10, "\n_No health posts found_\n"),
+    ('rss', 'articles', "\n---\n\n## 📰 RSS News Feed\n",
+     "\n**{i}. {title}**\n"
+     "- {source} • {category}\n"
+     "- {url}\n",
+     {'title': 'Untitled', 'source': 'unknown', 'category': '', 'url': ''},
+     15, "\n_No RSS articles found_\n"),
+]
+
+def select_highlights(results):
+    """Top items per platform for the digest, sliced once per run"""
+    return {
+        key: results[key][items_key][:limit]
+        for key, items_key, _, _, _, limit, _ in MARKDOWN_SECTIONS
+    }
+
+def generate_combined_markdown(results, now=None, highlights=None):
     """Generate combined markdown digest"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %I:%M %p PST")
+    timestamp = (now or datetime.now()).strftime("%Y-%m-%d %I:%M %p PST")
     total = sum(r['count'] for r in results.values())
+    if highlights is None:
+        highlights = select_highlights(results)
 
     # NOTE: Title and date are in HTML template, don't duplicate in markdown body
-    md = f"""**Total Opportunities: {total}**
-
----
-
-## 🟠 Reddit Business Leads
-
-"""
-    
-    # Add top 10 from each platform
-    if results['reddit']['count'] > 0:
-        for i, post in enumerate(results['reddit']['posts'][:10], 1):
-            md += f"\n**{i}. {post.get('title', 'Untitled')}**\n"
-            md += f"- r/{post.get('subreddit', 'unknown')} • u/{post.get('author', 'unknown')}\n"
-            md += f"- Score: {post.get('score', 0)} (↑{post.get('ups', 0)} • 💬{post.get('num_comments', 0)})\n"
-            md += f"- {post.get('url', '')}\n"
-    else:
-        md += "\n_No Reddit leads found_\n"
-    
-    md += "\n---\n\n## 🔵 Twitter Building Updates\n"
-    
-    if results['twitter']['count'] > 0:
-        for i, tweet in enumerate(results['twitter']['posts'][:10], 1):
-            md += f"\n**{i}. @{tweet.get('username', 'unknown')}**\n"
-            md += f"- {tweet.get('text', '')[:200]}...\n"
-            md += f"- ❤️{tweet.get('likes', 0)} 🔁{tweet.get('retweets', 0)} 💬{tweet.get('replies', 0)}\n"
-            md += f"- {tweet.get('url', '')}\n"
-    else:
-        md += "\n_No Twitter updates found_\n"
-    
-    md += "\n---\n\n## 🎥 YouTube AI Videos\n"
-    
-    if results['youtube']['count'] > 0:
-        for i, video in enumerate(results['youtube']['videos'][:10], 1):
-            md += f"\n**{i}. {video.get('title', 'Untitled')}**\n"
-            md += f"- Channel: {video.get('channel_name', 'unknown')}\n"
-            md += f"- {video.get('url', '')}\n"
-    else:
-        md += "\n_No YouTube videos found_\n"
-    
-    md += "\n---\n\n## 🤖 Moltbook Agent Builds\n"
-    
-    if results['moltbook']['count'] > 0:
-        for i, post in enumerate(results['moltbook']['posts'][:10], 1):
-            md += f"\n**{i}. {post.get('title', 'Untitled')}**\n"
-            md += f"- @{post.get('author', 'unknown')} • Score: {post.get('score', 0)}\n"
-            md += f"- {post.get('url', '')}\n"
-    else:
-        md += "\n_No Moltbook posts found_\n"
-    
-    md += "\n---\n\n## 🟢 Health & Wellness\n"
-    
-    if results['health']['count'] > 0:
-        for i, post in enumerate(results['health']['posts'][:10], 1):
-            md += f"\n**{i}. {post.get('title', 'Untitled')}**\n"
-            md += f"- Source: {post.get('source', 'unknown')}\n"
-            md += f"- {post.get('url', '')}\n"
-    else:
-        md += "\n_No health posts found_\n"
-    
-    md += "\n---\n\n## 📰 RSS News Feed\n"
-    
-    if results['rss']['count'] > 0:
-        for i, article in enumerate(results['rss']['articles'][:15], 1):
-            md += f"\n**{i}. {article.get('title', 'Untitled')}**\n"
-            md += f"- {article.get('source', 'unknown')} • {article.get('category', '')}\n"
-            md += f"- {article.get('url', '')}\n"
-    else:
-        md += "\n_No RSS articles found_\n"
+    md_parts = [f"**Total Opportunities: {total}**\n\n"]
+    
+    # Add top items from each platform
+    for key, _, heading, template, defaults, _, empty in MARKDOWN_SECTIONS:
+        md_parts.append(heading)
+        if results[key]['count'] > 0:
+            md_parts.extend(
+                template.format_map({**defaults, **item, 'i': i})
+                for i, item in enumerate(highlights[key], 1)
+            )
+        else:
+            md_parts.append(empty)
     
-    md += f"\n---\n\n_Generated by Bishop • Last updated: {timestamp}_\n"
+    md_parts.append(f"\n---\n\n_Generated by Bishop • Last updated: {timestamp}_\n")
     
-    return md
+    return ''.join(md_parts)
 
 if __name__ == "__main__":
-    run_full_digest()
+    # Same timestamp as the digest run, so the Daily folder matches the
+    # Database/ file names even if the run crosses midnight
+    run_started = datetime.now()
+    results = run_full_digest(run_started)
 
     # Create Daily folder structure
     print("\n📁 Creating Daily folder structure...")
-    date_str = datetime.now().strftime('%Y-%m-%d')
-    time_str = datetime.now().strftime('%I%p').lstrip('0')  # "6AM" or "5PM"
+    date_str = run_started.strftime('%Y-%m-%d')
+    time_str = run_started.strftime('%I%p').lstrip('0')  # "6AM" or "5PM"
     daily_folder = f'Daily/{date_str}-{time_str}'
     
     os.makedirs(daily_folder, exist_ok=True)
     
-    # Copy complete database files to Daily folder
+    # Copy complete database files to Daily folder (real copies, not hardlinks:
+    # add_titles_to_database.py and the add_*_previews.py scripts edit them in place)
     if os.path.exists(f'Database/all_items_{date_str}.html'):
         shutil.copy(f'Database/all_items_{date_str}.html', f'{daily_folder}/all_items.html')
         print(f"✅ Copied complete database: {daily_folder}/all_items.html")
@@ -336,19 +418,19 @@ if __name__ == "__main__":
         shutil.copy(f'Database/complete_{date_str}.json', f'{daily_folder}/complete.json')
         print(f"✅ Copied raw data: {daily_folder}/complete.json")
     
-    # Copy the digest
+    # Copy the digest (a real copy: add_footer_links.py edits dossier.html in place)
     if os.path.exists('dossier.html'):
         shutil.copy('dossier.html', f'{daily_folder}/digest.html')
         print(f"✅ Copied highlights: {daily_folder}/digest.html")
     
     # Add footer links to main dossier
     print("\n🔗 Adding footer links...")
-    subprocess.run(['python3', 'add_footer_links.py'], check=True)
+    add_footer('dossier.html', run_started)
     
     print(f"\n✅ Daily folder complete: {daily_folder}/")
 
-# After generating digest, create database with summaries
-print("\n📊 Creating database with summaries...")
-date_str = datetime.now().strftime('%Y-%m-%d_%H%M')
-subprocess.run(['python3', 'complete_with_titles.py'], timeout=180)
-print(f"✅ Database created: Database/complete_with_titles.html")
+    # After generating digest, create database with summaries from this
+    # run's results rather than scanning every platform a second time
+    print("\n📊 Creating database with summaries...")
+    build_database(results)
+    print(f"✅ Database created: Database/complete_with_titles.html")
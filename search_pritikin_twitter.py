@@ -2,20 +2,40 @@
 """
 Search Twitter for Pritikin Diet discussions
 """
+from functools import lru_cache
+
 import requests
 
-# Load bearer token
-with open('/home/drew/.openclaw/workspace/shared/credentials/twitter-api.txt', 'r') as f:
-    for line in f:
-        if line.startswith('BEARER_TOKEN='):
-            bearer_token = line.split('=', 1)[1].strip()
-            break
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+CREDENTIALS_FILE = '/home/drew/.openclaw/workspace/shared/credentials/twitter-api.txt'
+
+
+@lru_cache(maxsize=None)
+def load_bearer_token(path=CREDENTIALS_FILE):
+    """Read BEARER_TOKEN from the credentials file (parsed once per process)"""
+    with open(path, 'r') as f:
+        return next((line.split('=', 1)[1].strip() for line in f
+                     if line.startswith('BEARER_TOKEN=')), None)
+
+
+bearer_token = load_bearer_token()
+
+# One keep-alive connection for every page of results
+session = requests.Session()
 
 base_url = "https://api.twitter.com/2"
-headers = {
+session.headers.update({
     "Authorization": f"Bearer {bearer_token}",
     "User-Agent": "BishopDailyDossier/1.0"
-}
+})
+
+# Each page costs API quota - stop after this many
+MAX_PAGES = 5
 
 print("=" * 70)
 print("SEARCHING TWITTER FOR PRITIKIN DIET")
@@ -35,21 +55,28 @@ params = {
 }
 
 try:
-    response = requests.get(endpoint, headers=headers, params=params, timeout=10)
-    response.raise_for_status()
-    
-    data = response.json()
+    tweets = []
+    users = {}
+    for _ in range(MAX_PAGES):
+        response = session.get(endpoint, params=params, timeout=10)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+        tweets.extend(data.get('data', []))
+        users.update((user['id'], user) for user in data.get('includes', {}).get('users', []))
+        
+        next_token = data.get('meta', {}).get('next_token')
+        if not next_token:
+            break
+        params['next_token'] = next_token
     
-    if 'data' not in data or not data['data']:
+    if not tweets:
         print("⚠️ No tweets found about Pritikin Diet")
         print("\nThis could mean:")
         print("1. Free tier API doesn't include search (needs Basic tier $100/mo)")
         print("2. Very few people tweeting about it")
         print("\nManual search: https://twitter.com/search?q=pritikin%20diet")
     else:
-        tweets = data['data']
-        users = {user['id']: user for user in data.get('includes', {}).get('users', [])}
-        
         print(f"✅ Found {len(tweets)} tweets about Pritikin Diet\n")
         print("=" * 70)
         
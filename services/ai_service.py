@@ -5,65 +5,102 @@ Integrates Hugging Face transformers for content analysis, summarization, and re
 
 import os
 import json
+import hashlib
+import importlib.util
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import logging
+import re
+import threading
+from contextlib import nullcontext
+from collections import Counter
 import numpy as np
+from cachetools import LRUCache
 
-# AI/ML imports - all optional with compatibility checks
-try:
-    # Fix numpy compatibility issue
-    import numpy as np
-    if not hasattr(np, 'complex'):
-        # Add backward compatibility for older transformers
-        np.complex = complex
-        np.int = int
-        np.float = float
-        np.bool = bool
-    
-    from transformers import (
-        AutoTokenizer, AutoModelForSequenceClassification,
-        AutoModelForSeq2SeqLM, pipeline,
-        BartForConditionalGeneration, BartTokenizer
-    )
-    TRANSFORMERS_AVAILABLE = True
-except (ImportError, RuntimeError, AttributeError) as e:
-    TRANSFORMERS_AVAILABLE = False
-    print(f"Transformers not available: {e}")
-
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+# AI/ML dependencies are optional and heavy (seconds and ~1 GB to import), so
+# only check they are installed here; each is imported where it is first used
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    from sklearn.metrics.pairwise import cosine_similarity
-    from sklearn.cluster import KMeans
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+TRANSFORMERS_AVAILABLE = _module_available('transformers')
+ONNX_RUNTIME_AVAILABLE = _module_available('optimum.onnxruntime')
+SENTENCE_TRANSFORMERS_AVAILABLE = _module_available('sentence_transformers')
+TORCH_AVAILABLE = _module_available('torch')
+SKLEARN_AVAILABLE = _module_available('sklearn')
+FAISS_AVAILABLE = _module_available('faiss')
+NLTK_AVAILABLE = _module_available('nltk')
 
 try:
-    import nltk
-    NLTK_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    NLTK_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
 
 # Set overall availability
 ai_available = all([TRANSFORMERS_AVAILABLE, SENTENCE_TRANSFORMERS_AVAILABLE, TORCH_AVAILABLE, SKLEARN_AVAILABLE])
 
+
+def _import_transformers():
+    """Import transformers, restoring numpy aliases older releases still use"""
+    for name, alias in (('complex', complex), ('int', int), ('float', float), ('bool', bool)):
+        if not hasattr(np, name):
+            setattr(np, name, alias)
+    
+    import transformers
+    return transformers
+
+
+def _check_ai_imports() -> bool:
+    """
+    Import torch and transformers for real before the first model loads
+    
+    find_spec only shows the packages are installed. A broken install (e.g.
+    a CUDA/ABI mismatch) fails on import, and AI features then fall back to
+    keyword mode as if the packages were missing.
+    """
+    global ai_available
+    if ai_available:
+        try:
+            import torch  # noqa: F401
+            _import_transformers()
+        except (ImportError, RuntimeError, AttributeError) as e:
+            print(f"Transformers not available: {e}")
+            ai_available = False
+    return ai_available
+
+
+from utils.embedding_store import EmbeddingStore
 from utils.logging_config import get_logger, log_performance
 
+# Word lists for the keyword sentiment fallback, matched as whole words
+POSITIVE_WORDS = ['good', 'great', 'excellent', 'amazing', 'love', 'perfect', 'best', 'awesome']
+NEGATIVE_WORDS = ['bad', 'terrible', 'horrible', 'hate', 'worst', 'awful', 'disappointing', 'frustrating']
+
+# Terms that place a flat keywords.json entry in a category, in priority order
+_CATEGORY_TERMS = [
+    (term, category)
+    for category, terms in (
+        ("automation", ["automate", "automation", "manual", "repetitive", "streamline", "workflow"]),
+        ("integration", ["sync", "integration", "transfer", "export", "import", "connect", "systems"]),
+        ("scaling", ["scale", "bottleneck", "hundreds", "thousands", "bulk", "mass", "optimize"]),
+        ("pain_points", ["nightmare", "crazy", "struggle", "time-consuming", "tedious", "wasting"]),
+        ("budget", ["cost", "expensive", "budget", "price", "investment"]),
+    )
+    for term in terms
+]
+
+_POSITIVE_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, POSITIVE_WORDS)) + r')\b', re.IGNORECASE)
+_NEGATIVE_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, NEGATIVE_WORDS)) + r')\b', re.IGNORECASE)
+
+# BART's encoder window is 1024 tokens; longer posts are summarized in chunks
+SUMMARY_CHUNK_TOKENS = 900
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 class AIService:
     """
     Comprehensive AI service for Reddit content analysis
@@ -81,13 +118,24 @@ class AIService:
         self.pipelines = {}
         
         # Performance settings
-        self.device = "cuda" if TORCH_AVAILABLE and torch.cuda.is_available() else "cpu"
+        self.device = self._detect_device()
+        self._inference_context = nullcontext  # torch.inference_mode once models load
         self.max_workers = self.config.get('ai_max_workers', 4)
         self.thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.sentiment_batch_size = self.config.get('sentiment_batch_size', 16)
         
-        # Cache for embeddings and model outputs
-        self.embeddings_cache = {}
-        self.analysis_cache = {}
+        # Async sentiment requests are coalesced by one worker per event loop
+        self._sentiment_queue: Optional[asyncio.Queue] = None
+        self._sentiment_worker_task: Optional[asyncio.Task] = None
+        
+        # Bounded caches for embeddings and model outputs; LRUCache reorders
+        # entries on every read, so all access goes through _cache_lock
+        cache_size = self.config.get('cache_size', 10_000)
+        self.embeddings_cache = LRUCache(maxsize=cache_size)
+        self.analysis_cache = LRUCache(maxsize=cache_size)
+        self._cache_lock = threading.RLock()
+        # On-disk embedding store, opened once the embedding model has loaded
+        self.embedding_store: Optional[EmbeddingStore] = None
         
         # Business keyword patterns
         self.business_keywords = self._load_business_keywords()
@@ -97,6 +145,40 @@ class AIService:
         
         self.logger.info(f"AI Service initialized with device: {self.device}")
     
+    def _detect_device(self) -> str:
+        """Use CUDA when available; torch is only imported if models will load"""
+        if self.config.get('skip_model_loading', False) or not _check_ai_imports():
+            return "cpu"
+        
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    
+    @staticmethod
+    def _cache_key(prefix: str, text: str, *params) -> Tuple:
+        """
+        Build a cache key from a short stable digest of text
+        
+        Unlike hash(), the digest is the same in every process, and the
+        cache never has to hold the full text as part of the key.
+        """
+        digest = hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=8).digest()
+        return (prefix, digest, *params)
+    
+    def _cached(self, key: Tuple, compute) -> Any:
+        """
+        Return the analysis_cache entry for key, computing and storing it on a miss
+        
+        The lock is only held around cache access, not while compute runs,
+        so concurrent callers never serialize on model inference.
+        """
+        with self._cache_lock:
+            value = self.analysis_cache.get(key)
+        if value is None:
+            value = compute()
+            with self._cache_lock:
+                self.analysis_cache[key] = value
+        return value
+    
     def _load_business_keywords(self) -> Dict[str, List[str]]:
         """Load business opportunity keywords from JSON file"""
         try:
@@ -149,52 +231,13 @@ class AIService:
             "general": []
         }
         
-        automation_terms = ["automate", "automation", "manual", "repetitive", "streamline", "workflow"]
-        integration_terms = ["sync", "integration", "transfer", "export", "import", "connect", "systems"]
-        scaling_terms = ["scale", "bottleneck", "hundreds", "thousands", "bulk", "mass", "optimize"]
-        pain_terms = ["nightmare", "crazy", "struggle", "time-consuming", "tedious", "wasting"]
-        budget_terms = ["cost", "expensive", "budget", "price", "investment"]
-        
         for keyword in keywords_list:
             keyword_lower = keyword.lower()
-            categorized_flag = False
-            
-            for term in automation_terms:
-                if term in keyword_lower:
-                    categorized["automation"].append(keyword)
-                    categorized_flag = True
-                    break
-            
-            if not categorized_flag:
-                for term in integration_terms:
-                    if term in keyword_lower:
-                        categorized["integration"].append(keyword)
-                        categorized_flag = True
-                        break
-            
-            if not categorized_flag:
-                for term in scaling_terms:
-                    if term in keyword_lower:
-                        categorized["scaling"].append(keyword)
-                        categorized_flag = True
-                        break
-            
-            if not categorized_flag:
-                for term in pain_terms:
-                    if term in keyword_lower:
-                        categorized["pain_points"].append(keyword)
-                        categorized_flag = True
-                        break
-            
-            if not categorized_flag:
-                for term in budget_terms:
-                    if term in keyword_lower:
-                        categorized["budget"].append(keyword)
-                        categorized_flag = True
-                        break
-            
-            if not categorized_flag:
-                categorized["general"].append(keyword)
+            category = next(
+                (category for term, category in _CATEGORY_TERMS if term in keyword_lower),
+                "general"
+            )
+            categorized[category].append(keyword)
         
         # Remove empty categories
         return {k: v for k, v in categorized.items() if v}
@@ -213,6 +256,7 @@ class AIService:
         
         try:
             self.logger.info("Loading AI models...")
+            self._configure_torch()
             
             # Only load models if explicitly requested and available
             if self.config.get('load_summarization', True):
@@ -234,17 +278,35 @@ class AIService:
             # Don't raise - continue with fallback methods
             self.logger.warning("Continuing with fallback AI methods")
     
+    def _configure_torch(self):
+        """Run model calls without autograd bookkeeping; allow TF32 matmuls on CUDA"""
+        import torch
+        self._inference_context = torch.inference_mode
+        
+        if self.device == "cuda":
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision('high')
+    
     def _load_summarization_model(self):
         """Load summarization model"""
         model_name = self.config.get('summarization_model', 'facebook/bart-large-cnn')
         
         try:
-            self.tokenizers['summarization'] = BartTokenizer.from_pretrained(model_name)
-            self.models['summarization'] = BartForConditionalGeneration.from_pretrained(model_name)
+            if self.config.get('summarization_backend') == 'onnx':
+                if ONNX_RUNTIME_AVAILABLE:
+                    self._load_onnx_summarization_model(model_name)
+                    return
+                self.logger.warning("optimum[onnxruntime] not installed, using PyTorch summarizer")
+            
+            transformers = _import_transformers()
+            self.tokenizers['summarization'] = transformers.BartTokenizer.from_pretrained(model_name)
+            self.models['summarization'] = self._quantize_for_cpu(
+                transformers.BartForConditionalGeneration.from_pretrained(model_name)
+            )
             self.models['summarization'].to(self.device)
             
             # Create pipeline for easier use
-            self.pipelines['summarization'] = pipeline(
+            self.pipelines['summarization'] = transformers.pipeline(
                 "summarization",
                 model=self.models['summarization'],
                 tokenizer=self.tokenizers['summarization'],
@@ -258,16 +320,41 @@ class AIService:
             # Fallback to a simpler extraction-based summarization
             self.pipelines['summarization'] = None
     
+    def _load_onnx_summarization_model(self, model_name: str):
+        """Export the summarizer to ONNX and serve it through ONNX Runtime"""
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        
+        transformers = _import_transformers()
+        provider = "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+        
+        self.tokenizers['summarization'] = transformers.BartTokenizer.from_pretrained(model_name)
+        self.models['summarization'] = ORTModelForSeq2SeqLM.from_pretrained(
+            model_name,
+            export=True,
+            use_cache=True,  # Reuse decoder key/values between generation steps
+            provider=provider
+        )
+        
+        self.pipelines['summarization'] = transformers.pipeline(
+            "summarization",
+            model=self.models['summarization'],
+            tokenizer=self.tokenizers['summarization']
+        )
+        
+        self.logger.info(f"Summarization model loaded with ONNX Runtime ({provider}): {model_name}")
+    
     def _load_sentiment_model(self):
         """Load sentiment analysis model"""
         model_name = self.config.get('sentiment_model', 'cardiffnlp/twitter-roberta-base-sentiment-latest')
         
         try:
-            self.pipelines['sentiment'] = pipeline(
+            transformers = _import_transformers()
+            self.pipelines['sentiment'] = transformers.pipeline(
                 "sentiment-analysis",
                 model=model_name,
                 device=0 if self.device == "cuda" else -1
             )
+            self.pipelines['sentiment'].model = self._quantize_for_cpu(self.pipelines['sentiment'].model)
             
             self.logger.info(f"Sentiment model loaded: {model_name}")
             
@@ -275,18 +362,75 @@ class AIService:
             self.logger.error(f"Failed to load sentiment model: {e}")
             self.pipelines['sentiment'] = None
     
+    def _quantize_for_cpu(self, model):
+        """
+        Quantize a model's Linear layers to INT8 for CPU inference
+        
+        Dynamic quantization roughly halves matmul time and shrinks weights
+        ~4x on CPU. Skipped on GPU or when config 'use_int8' is False; any
+        failure leaves the FP32 model in place.
+        """
+        if self.device != "cpu" or not self.config.get('use_int8', True):
+            return model
+        
+        try:
+            import torch
+            return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        except Exception as e:
+            self.logger.warning(f"INT8 quantization failed, using FP32 model: {e}")
+            return model
+    
     def _load_sentence_transformer(self):
         """Load sentence transformer for embeddings"""
         model_name = self.config.get('embedding_model', 'all-MiniLM-L6-v2')
         
         try:
-            self.models['embeddings'] = SentenceTransformer(model_name)
+            from sentence_transformers import SentenceTransformer
+            self.models['embeddings'] = SentenceTransformer(model_name, device=self.device)
+            backbone = self.models['embeddings']._first_module()
+            backbone.auto_model = self._quantize_for_cpu(backbone.auto_model)
+            self._compile_embedding_model()
             self.logger.info(f"Sentence transformer loaded: {model_name}")
             
+            # Embeddings survive restarts; set embedding_cache_path to None to disable
+            store_path = self.config.get('embedding_cache_path', '.embedding_cache.sqlite3')
+            if store_path:
+                try:
+                    self.embedding_store = EmbeddingStore(store_path, model_name)
+                except Exception as e:
+                    self.logger.warning(f"Embedding store unavailable: {e}")
+            
         except Exception as e:
             self.logger.error(f"Failed to load sentence transformer: {e}")
             self.models['embeddings'] = None
     
+    def _compile_embedding_model(self):
+        """
+        Compile the sentence transformer backbone with torch.compile on CUDA
+        
+        MiniLM is small enough that encode() is dominated by kernel launches;
+        reduce-overhead mode replays them as CUDA graphs. Two warm-up encodes
+        trigger compilation here instead of on the first real request.
+        """
+        if self.device != "cuda" or not self.config.get('compile_embeddings', True):
+            return
+        
+        import torch
+        if not hasattr(torch, 'compile'):
+            return
+        
+        backbone = self.models['embeddings']._first_module()
+        eager_model = backbone.auto_model
+        try:
+            backbone.auto_model = torch.compile(
+                eager_model, mode='reduce-overhead', fullgraph=False, dynamic=True
+            )
+            for _ in range(2):
+                self.models['embeddings'].encode(['x' * 32] * 8, show_progress_bar=False)
+        except Exception as e:
+            backbone.auto_model = eager_model
+            self.logger.warning(f"torch.compile failed, using eager embedding model: {e}")
+    
     def _setup_business_classifier(self):
         """Setup custom business opportunity classifier"""
         # This could be a custom model trained on business data
@@ -301,6 +445,38 @@ class AIService:
                 'budget': 1.2
             }
         }
+        self._keyword_automaton = self._build_keyword_automaton()
+        # Lowercased once here for the substring scan used without the automaton
+        self._lowered_keywords = {
+            category: [(keyword, keyword.lower()) for keyword in keywords]
+            for category, keywords in self.business_keywords.items()
+        }
+    
+    def _build_keyword_automaton(self):
+        """
+        Build one Aho-Corasick automaton over every business keyword
+        
+        Each lowercased term maps to the (category, keyword) pairs it came
+        from, so a single pass over the text finds matches for all
+        categories at once. Returns None when pyahocorasick is missing.
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        owners: Dict[str, List[Tuple[str, str]]] = {}
+        for category, keywords in self.business_keywords.items():
+            for keyword in keywords:
+                if keyword:
+                    owners.setdefault(keyword.lower(), []).append((category, keyword))
+        
+        if not owners:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for term, term_owners in owners.items():
+            automaton.add_word(term, term_owners)
+        automaton.make_automaton()
+        return automaton
     
     @log_performance
     def summarize_text(self, text: str, max_length: int = 150, min_length: int = 50) -> Dict[str, Any]:
@@ -323,36 +499,11 @@ class AIService:
                 'word_count': len(text.split())
             }
         
-        # Check cache first
-        cache_key = f"summary_{hash(text)}_{max_length}_{min_length}"
-        if cache_key in self.analysis_cache:
-            return self.analysis_cache[cache_key]
-        
         try:
-            if self.pipelines.get('summarization'):
-                # Use AI summarization
-                result = self.pipelines['summarization'](
-                    text,
-                    max_length=max_length,
-                    min_length=min_length,
-                    do_sample=False
-                )
-                
-                summary_result = {
-                    'summary': result[0]['summary_text'],
-                    'confidence': 0.9,
-                    'method': 'ai_bart',
-                    'word_count': len(result[0]['summary_text'].split()),
-                    'original_length': len(text.split()),
-                    'compression_ratio': len(result[0]['summary_text'].split()) / len(text.split())
-                }
-            else:
-                # Fallback to extractive summarization
-                summary_result = self._extractive_summarization(text, max_length)
-            
-            # Cache the result
-            self.analysis_cache[cache_key] = summary_result
-            return summary_result
+            return self._cached(
+                self._cache_key('summary', text, max_length, min_length),
+                lambda: self._generate_summary(text, max_length, min_length)
+            )
             
         except Exception as e:
             self.logger.error(f"Summarization failed: {e}")
@@ -365,6 +516,84 @@ class AIService:
                 'error': str(e)
             }
     
+    def _generate_summary(self, text: str, max_length: int, min_length: int) -> Dict[str, Any]:
+        """Summarize with the model if loaded, else extractively"""
+        if not self.pipelines.get('summarization'):
+            # Fallback to extractive summarization
+            return self._extractive_summarization(text, max_length)
+        
+        summary = self._summarize_with_model(text, max_length, min_length)
+        return {
+            'summary': summary,
+            'confidence': 0.9,
+            'method': 'ai_bart',
+            'word_count': len(summary.split()),
+            'original_length': len(text.split()),
+            'compression_ratio': len(summary.split()) / len(text.split())
+        }
+    
+    def _summarize_with_model(self, text: str, max_length: int, min_length: int) -> str:
+        """
+        Run the summarization pipeline, chunking posts longer than the encoder window
+        
+        Chunks are summarized in one batched call and the joined chunk
+        summaries are summarized once more if they still exceed max_length.
+        Chunk summaries are cached on their own so reposts sharing
+        boilerplate paragraphs reuse them.
+        """
+        summarizer = self.pipelines['summarization']
+        tokenizer = self.tokenizers.get('summarization')
+        chunks = self._split_for_summarization(text, tokenizer) if tokenizer else [text]
+        
+        if len(chunks) == 1:
+            with self._inference_context():
+                result = summarizer(text, max_length=max_length, min_length=min_length,
+                                    do_sample=False, truncation=True)
+            return result[0]['summary_text']
+        
+        chunk_max = max_length // len(chunks) + 16
+        chunk_min = min(min_length // len(chunks), chunk_max - 1)
+        keys = [self._cache_key('summary_chunk', chunk, chunk_max, chunk_min) for chunk in chunks]
+        with self._cache_lock:
+            summaries = [self.analysis_cache.get(key) for key in keys]
+        
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        if missing:
+            with self._inference_context():
+                results = summarizer([chunks[i] for i in missing], max_length=chunk_max,
+                                     min_length=chunk_min, do_sample=False, truncation=True,
+                                     batch_size=len(missing))
+            with self._cache_lock:
+                for i, result in zip(missing, results):
+                    summaries[i] = result['summary_text']
+                    self.analysis_cache[keys[i]] = summaries[i]
+        
+        combined = ' '.join(summaries)
+        if len(tokenizer.encode(combined, add_special_tokens=False)) > max_length:
+            with self._inference_context():
+                result = summarizer(combined, max_length=max_length, min_length=min_length,
+                                    do_sample=False, truncation=True)
+            combined = result[0]['summary_text']
+        return combined
+    
+    def _split_for_summarization(self, text: str, tokenizer) -> List[str]:
+        """Greedy-pack sentences into chunks of at most SUMMARY_CHUNK_TOKENS tokens"""
+        sentences = _SENTENCE_SPLIT_RE.split(text.strip())
+        lengths = [len(ids) for ids in tokenizer(sentences, add_special_tokens=False)['input_ids']]
+        if sum(lengths) <= SUMMARY_CHUNK_TOKENS:
+            return [text]
+        
+        chunks, current, current_length = [], [], 0
+        for sentence, length in zip(sentences, lengths):
+            if current and current_length + length > SUMMARY_CHUNK_TOKENS:
+                chunks.append(' '.join(current))
+                current, current_length = [], 0
+            current.append(sentence)
+            current_length += length
+        if current:
+            chunks.append(' '.join(current))
+        return chunks
+    
     def _extractive_summarization(self, text: str, max_length: int) -> Dict[str, Any]:
         """Simple extractive summarization fallback"""
         sentences = text.split('. ')
@@ -410,53 +639,150 @@ class AIService:
         Returns:
             Dictionary containing sentiment analysis results
         """
-        if not text or len(text.strip()) < 10:
-            return {
-                'label': 'NEUTRAL',
-                'score': 0.5,
-                'confidence': 0.1,
-                'method': 'default'
-            }
+        return self.analyze_sentiment_batch([text])[0]
+    
+    @log_performance
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of several texts with batched model calls
+        
+        Uncached texts are sorted by length and sent to the model in buckets,
+        so each batch pads to a similar length instead of the longest post.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            Sentiment analysis results in the same order as texts
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}  # uncached text -> positions in texts
+        
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 10:
+                results[i] = {
+                    'label': 'NEUTRAL',
+                    'score': 0.5,
+                    'confidence': 0.1,
+                    'method': 'default'
+                }
+                continue
+            
+            with self._cache_lock:
+                cached = self.analysis_cache.get(self._cache_key('sentiment', text))
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(text, []).append(i)
         
-        cache_key = f"sentiment_{hash(text)}"
-        if cache_key in self.analysis_cache:
-            return self.analysis_cache[cache_key]
+        if not pending:
+            return results
         
         try:
             if self.pipelines.get('sentiment'):
-                result = self.pipelines['sentiment'](text[:512])  # Limit length for model
+                unique_texts = sorted(pending, key=len)
+                batch_size = self.sentiment_batch_size
                 
-                sentiment_result = {
-                    'label': result[0]['label'],
-                    'score': result[0]['score'],
-                    'confidence': result[0]['score'],
-                    'method': 'ai_roberta'
-                }
+                for start in range(0, len(unique_texts), batch_size):
+                    bucket = unique_texts[start:start + batch_size]
+                    with self._inference_context():
+                        outputs = self.pipelines['sentiment'](
+                            bucket,
+                            batch_size=len(bucket),
+                            truncation=True,
+                            max_length=512  # Limit length for model
+                        )
+                    
+                    for text, output in zip(bucket, outputs):
+                        sentiment_result = {
+                            'label': output['label'],
+                            'score': output['score'],
+                            'confidence': output['score'],
+                            'method': 'ai_roberta'
+                        }
+                        with self._cache_lock:
+                            self.analysis_cache[self._cache_key('sentiment', text)] = sentiment_result
+                        for i in pending[text]:
+                            results[i] = sentiment_result
             else:
                 # Simple keyword-based sentiment analysis
-                sentiment_result = self._keyword_sentiment_analysis(text)
-            
-            self.analysis_cache[cache_key] = sentiment_result
-            return sentiment_result
+                for text, positions in pending.items():
+                    sentiment_result = self._keyword_sentiment_analysis(text)
+                    with self._cache_lock:
+                        self.analysis_cache[self._cache_key('sentiment', text)] = sentiment_result
+                    for i in positions:
+                        results[i] = sentiment_result
             
         except Exception as e:
             self.logger.error(f"Sentiment analysis failed: {e}")
-            return {
-                'label': 'NEUTRAL',
-                'score': 0.5,
-                'confidence': 0.2,
-                'method': 'fallback',
-                'error': str(e)
-            }
+            for positions in pending.values():
+                for i in positions:
+                    if results[i] is None:
+                        results[i] = {
+                            'label': 'NEUTRAL',
+                            'score': 0.5,
+                            'confidence': 0.2,
+                            'method': 'fallback',
+                            'error': str(e)
+                        }
+        
+        return results
+    
+    async def analyze_sentiment_async(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment without blocking the event loop
+        
+        Requests are queued for a single background worker that gathers
+        whatever arrives within a few milliseconds into one batched model
+        call, so concurrent callers share a forward pass.
+        
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            Dictionary containing sentiment analysis results
+        """
+        loop = asyncio.get_running_loop()
+        task = self._sentiment_worker_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._sentiment_queue = asyncio.Queue()
+            self._sentiment_worker_task = loop.create_task(self._sentiment_worker(self._sentiment_queue))
+        
+        future = loop.create_future()
+        await self._sentiment_queue.put((text, future))
+        return await future
+    
+    async def _sentiment_worker(self, queue: asyncio.Queue):
+        """Drain queued sentiment requests in batches and resolve their futures"""
+        loop = asyncio.get_running_loop()
+        max_batch = self.max_workers * 8
+        
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=0.005))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                results = await loop.run_in_executor(
+                    self.thread_pool, self.analyze_sentiment_batch, [text for text, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
     
     def _keyword_sentiment_analysis(self, text: str) -> Dict[str, Any]:
         """Simple keyword-based sentiment analysis fallback"""
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'love', 'perfect', 'best', 'awesome']
-        negative_words = ['bad', 'terrible', 'horrible', 'hate', 'worst', 'awful', 'disappointing', 'frustrating']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        positive_count = len(_POSITIVE_RE.findall(text))
+        negative_count = len(_NEGATIVE_RE.findall(text))
         
         total_sentiment_words = positive_count + negative_count
         
@@ -492,36 +818,11 @@ class AIService:
         Returns:
             Dictionary containing business opportunity analysis
         """
-        cache_key = f"business_{hash(text)}"
-        if cache_key in self.analysis_cache:
-            return self.analysis_cache[cache_key]
-        
         try:
-            # Keyword-based analysis
-            keyword_analysis = self._analyze_business_keywords(text)
-            
-            # Sentiment analysis for urgency detection
-            sentiment = self.analyze_sentiment(text)
-            
-            # Calculate opportunity score
-            opportunity_score = self._calculate_opportunity_score(keyword_analysis, sentiment)
-            
-            # Detect specific business categories
-            categories = self._detect_business_categories(text, keyword_analysis)
-            
-            result = {
-                'opportunity_score': opportunity_score,
-                'categories': categories,
-                'keywords_found': keyword_analysis['matched_keywords'],
-                'keyword_count': keyword_analysis['total_matches'],
-                'sentiment': sentiment,
-                'urgency_level': self._assess_urgency(text, sentiment),
-                'confidence': min(1.0, keyword_analysis['total_matches'] * 0.2 + sentiment['confidence'] * 0.3),
-                'recommendations': self._generate_opportunity_recommendations(keyword_analysis, categories)
-            }
-            
-            self.analysis_cache[cache_key] = result
-            return result
+            return self._cached(
+                self._cache_key('business', text),
+                lambda: self._analyze_business_opportunity(text)
+            )
             
         except Exception as e:
             self.logger.error(f"Business opportunity detection failed: {e}")
@@ -536,17 +837,92 @@ class AIService:
                 'error': str(e)
             }
     
-    def _analyze_business_keywords(self, text: str) -> Dict[str, Any]:
-        """Analyze text for business-related keywords"""
+    def _analyze_business_opportunity(self, text: str) -> Dict[str, Any]:
+        """Build the business opportunity analysis for one text (uncached)"""
+        # Lowercase once for every keyword pass below
         text_lower = text.lower()
+        
+        # Keyword-based analysis
+        keyword_analysis = self._analyze_business_keywords(text, text_lower)
+        
+        # Sentiment analysis for urgency detection
+        sentiment = self.analyze_sentiment(text)
+        
+        # Calculate opportunity score
+        opportunity_score = self._calculate_opportunity_score(keyword_analysis, sentiment)
+        
+        # Detect specific business categories
+        categories = self._detect_business_categories(text, keyword_analysis)
+        
+        return {
+            'opportunity_score': opportunity_score,
+            'categories': categories,
+            'keywords_found': keyword_analysis['matched_keywords'],
+            'keyword_count': keyword_analysis['total_matches'],
+            'sentiment': sentiment,
+            'urgency_level': self._assess_urgency(text, sentiment, text_lower),
+            'confidence': min(1.0, keyword_analysis['total_matches'] * 0.2 + sentiment['confidence'] * 0.3),
+            'recommendations': self._generate_opportunity_recommendations(keyword_analysis, categories)
+        }
+    
+    def detect_business_opportunities_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Detect business opportunities in several texts
+        
+        Sentiment for all texts is computed up front in batched model calls;
+        the per-text analysis then reads it from the cache.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            Business opportunity analyses in the same order as texts
+        """
+        self.analyze_sentiment_batch(texts)
+        return [self.detect_business_opportunities(text) for text in texts]
+    
+    def opportunity_score_upper_bound(self, text: str) -> float:
+        """
+        Highest opportunity_score text could get, from keyword matching alone
+        
+        Sentiment only scales the keyword score, so assuming the most
+        favourable label bounds the result without running the model.
+        Texts whose bound is under a score threshold can skip
+        detect_business_opportunities entirely.
+        
+        Args:
+            text: Input text to check
+        
+        Returns:
+            Upper bound on detect_business_opportunities(text)['opportunity_score']
+            (0.0 where detection would fail and score the text 0.0 too)
+        """
+        try:
+            keyword_analysis = self._analyze_business_keywords(text)
+            return self._calculate_opportunity_score(keyword_analysis, {'label': 'NEGATIVE'})
+        except Exception as e:
+            self.logger.error(f"Business opportunity detection failed: {e}")
+            return 0.0
+    
+    def _analyze_business_keywords(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze text for business-related keywords (text_lower: text.lower() if already computed)"""
+        if text_lower is None:
+            text_lower = text.lower()
         matched_keywords = {}
         total_score = 0.0
         
+        automaton = getattr(self, '_keyword_automaton', None)
+        if automaton is not None:
+            # One linear scan of the text for all categories
+            found = set()
+            for _, term_owners in automaton.iter(text_lower):
+                found.update(term_owners)
+        
         for category, keywords in self.business_keywords.items():
-            category_matches = []
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    category_matches.append(keyword)
+            if automaton is not None:
+                category_matches = [kw for kw in keywords if (category, kw) in found]
+            else:
+                category_matches = [kw for kw, kw_lower in self._lowered_keywords[category] if kw_lower in text_lower]
             
             if category_matches:
                 matched_keywords[category] = category_matches
@@ -596,15 +972,16 @@ class AIService:
         
         return categories
     
-    def _assess_urgency(self, text: str, sentiment: Dict) -> str:
-        """Assess urgency level of the business need"""
+    def _assess_urgency(self, text: str, sentiment: Dict, text_lower: Optional[str] = None) -> str:
+        """Assess urgency level of the business need (text_lower: text.lower() if already computed)"""
         urgency_keywords = {
             'high': ['urgent', 'asap', 'immediately', 'crisis', 'emergency', 'breaking', 'critical'],
             'medium': ['soon', 'quickly', 'fast', 'deadline', 'rushing', 'hurry'],
             'low': ['eventually', 'someday', 'thinking about', 'considering', 'maybe']
         }
         
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         for level, keywords in urgency_keywords.items():
             if any(keyword in text_lower for keyword in keywords):
@@ -645,16 +1022,67 @@ class AIService:
             return self._simple_text_embeddings(texts)
         
         try:
-            embeddings = self.models['embeddings'].encode(texts)
-            return embeddings
+            model = self.models['embeddings']
+            if not texts:
+                return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+            
+            # Only encode texts not seen before; repeats come from the cache
+            keys = [self._cache_key('embedding', text) for text in texts]
+            with self._cache_lock:
+                vectors = [self.embeddings_cache.get(key) for key in keys]
+            if self.embedding_store is not None and any(vector is None for vector in vectors):
+                self._load_stored_embeddings(keys, vectors)
+            missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+            
+            if missing:
+                with self._inference_context():
+                    encoded = model.encode(
+                        missing,
+                        batch_size=64,
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,  # Cosine similarity becomes a dot product
+                        show_progress_bar=False
+                    )
+                fresh = dict(zip(missing, encoded))
+                if self.embedding_store is not None:
+                    try:
+                        self.embedding_store.put_many(
+                            (self._cache_key('embedding', text)[1], vector) for text, vector in fresh.items()
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"Embedding store write failed: {e}")
+                with self._cache_lock:
+                    for i, vector in enumerate(vectors):
+                        if vector is None:
+                            vectors[i] = fresh[texts[i]]
+                            self.embeddings_cache[keys[i]] = vectors[i]
+            
+            return np.stack(vectors)
         except Exception as e:
             self.logger.error(f"Embedding generation failed: {e}")
             return self._simple_text_embeddings(texts)
     
+    def _load_stored_embeddings(self, keys: List[Tuple], vectors: List[Optional[np.ndarray]]):
+        """Fill in cache misses from the on-disk store, promoting hits to memory"""
+        try:
+            stored = self.embedding_store.get_many(
+                list({key[1] for key, vector in zip(keys, vectors) if vector is None})
+            )
+        except Exception as e:
+            self.logger.warning(f"Embedding store lookup failed: {e}")
+            return
+        
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                if vectors[i] is None and key[1] in stored:
+                    vectors[i] = stored[key[1]]
+                    self.embeddings_cache[key] = vectors[i]
+    
     def _simple_text_embeddings(self, texts: List[str]) -> np.ndarray:
         """Simple TF-IDF based embeddings fallback"""
         if SKLEARN_AVAILABLE:
             try:
+                from sklearn.feature_extraction.text import TfidfVectorizer
                 vectorizer = TfidfVectorizer(max_features=100, stop_words='english')
                 embeddings = vectorizer.fit_transform(texts).toarray()
                 return embeddings
@@ -663,21 +1091,23 @@ class AIService:
         
         # Ultra simple word-based embeddings if sklearn not available
         try:
-            import numpy as np
-            # Create simple word frequency vectors
-            all_words = set()
-            for text in texts:
-                all_words.update(text.lower().split())
-            
-            word_list = list(all_words)[:100]  # Limit to 100 most common words
-            embeddings = []
+            # Create simple word frequency vectors over the 100 most common words
+            tokenized = [text.lower().split() for text in texts]
+            word_counts = Counter(word for words in tokenized for word in words)
+            vocabulary = {word: col for col, (word, _) in enumerate(word_counts.most_common(100))}
             
-            for text in texts:
-                words = text.lower().split()
-                vector = [words.count(word) for word in word_list]
-                embeddings.append(vector)
+            # One pass over the words, then a single scatter-add into the matrix
+            rows, cols = [], []
+            for row, words in enumerate(tokenized):
+                for word in words:
+                    col = vocabulary.get(word)
+                    if col is not None:
+                        rows.append(row)
+                        cols.append(col)
             
-            return np.array(embeddings)
+            embeddings = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+            np.add.at(embeddings, (rows, cols), 1)
+            return embeddings
         except Exception as e:
             self.logger.error(f"Simple embedding failed: {e}")
             # Return zero embeddings as last resort
@@ -686,9 +1116,7 @@ class AIService:
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
         try:
-            embeddings = self.generate_content_embeddings([text1, text2])
-            similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-            return float(similarity)
+            return float(self.calculate_similarity_matrix([text1], [text2])[0, 0])
         except Exception as e:
             self.logger.error(f"Similarity calculation failed: {e}")
             # Fallback to simple word overlap
@@ -698,6 +1126,35 @@ class AIService:
                 return 0.0
             return len(words1.intersection(words2)) / len(words1.union(words2))
     
+    def calculate_similarity_matrix(self, texts_a: List[str], texts_b: List[str]) -> np.ndarray:
+        """
+        Cosine similarity of every text in texts_a against every text in texts_b
+        
+        Both lists are embedded in one call (so fallback embeddings share a
+        vocabulary) and compared with a single matrix product. Large matrices
+        on CUDA are multiplied in bfloat16 to halve the bytes moved.
+        
+        Returns:
+            Array of shape (len(texts_a), len(texts_b))
+        """
+        embeddings = self.generate_content_embeddings(list(texts_a) + list(texts_b))
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        
+        if not self.models.get('embeddings'):
+            # Sentence embeddings are already unit-length; fallbacks may not be
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.where(norms == 0, 1, norms)
+        
+        a, b = embeddings[:len(texts_a)], embeddings[len(texts_a):]
+        
+        if self.device == "cuda" and a.shape[0] * b.shape[0] >= 4096:
+            import torch
+            a_gpu = torch.from_numpy(a).to('cuda', dtype=torch.bfloat16)
+            b_gpu = torch.from_numpy(b).to('cuda', dtype=torch.bfloat16)
+            return (a_gpu @ b_gpu.T).float().cpu().numpy()
+        
+        return a @ b.T
+    
     def cluster_content(self, texts: List[str], n_clusters: int = 5) -> Dict[str, Any]:
         """Cluster content using embeddings"""
         if len(texts) < n_clusters:
@@ -708,8 +1165,24 @@ class AIService:
             }
         
         try:
-            embeddings = self.generate_content_embeddings(texts)
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+            # float32 and C-contiguous is what FAISS/BLAS want - convert once
+            embeddings = np.ascontiguousarray(self.generate_content_embeddings(texts), dtype=np.float32)
+            # Unit-length rows make k-means cluster by cosine similarity; model
+            # embeddings already are, the keyword fallback vectors are not
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+            
+            # FAISS needs ~39 points per centroid to train well; small sets stay on sklearn
+            if FAISS_AVAILABLE and len(texts) >= 39 * n_clusters:
+                return self._faiss_kmeans(embeddings, n_clusters)
+            
+            from sklearn.cluster import KMeans, MiniBatchKMeans
+            if len(texts) > 5_000:
+                kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=1024, n_init=1, random_state=42)
+            else:
+                # One well-seeded (k-means++) run converges fine on normalized embeddings
+                kmeans = KMeans(n_clusters=n_clusters, n_init=1, algorithm='elkan',
+                                max_iter=50, tol=1e-3, random_state=42)
             cluster_labels = kmeans.fit_predict(embeddings)
             
             return {
@@ -728,6 +1201,22 @@ class AIService:
                 'error': str(e)
             }
     
+    def _faiss_kmeans(self, embeddings: np.ndarray, n_clusters: int) -> Dict[str, Any]:
+        """Cluster embeddings with FAISS k-means (BLAS on CPU, CUDA when available)"""
+        import faiss
+        
+        use_gpu = self.device == "cuda" and hasattr(faiss, 'StandardGpuResources')
+        kmeans = faiss.Kmeans(embeddings.shape[1], n_clusters, niter=20, seed=42, gpu=use_gpu)
+        kmeans.train(embeddings)
+        distances, labels = kmeans.index.search(embeddings, 1)
+        
+        return {
+            'clusters': labels.ravel().tolist(),
+            'cluster_centers': kmeans.centroids.tolist(),
+            'inertia': float(distances.sum()),
+            'method': 'faiss_kmeans'
+        }
+    
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about loaded models"""
         return {
@@ -744,22 +1233,33 @@ class AIService:
     
     def clear_cache(self, cache_type: Optional[str] = None):
         """Clear AI service caches"""
-        if cache_type == 'embeddings' or cache_type is None:
-            self.embeddings_cache.clear()
-        
-        if cache_type == 'analysis' or cache_type is None:
-            self.analysis_cache.clear()
+        with self._cache_lock:
+            if cache_type == 'embeddings' or cache_type is None:
+                self.embeddings_cache.clear()
+            
+            if cache_type == 'analysis' or cache_type is None:
+                self.analysis_cache.clear()
         
         self.logger.info(f"Cleared {cache_type or 'all'} caches")
     
     def close(self):
         """Clean up resources"""
         try:
+            task = self._sentiment_worker_task
+            if task is not None and not task.done():
+                try:
+                    task.get_loop().call_soon_threadsafe(task.cancel)
+                except RuntimeError:
+                    pass  # Event loop already closed
+            
             self.thread_pool.shutdown(wait=True)
             self.clear_cache()
+            if self.embedding_store is not None:
+                self.embedding_store.close()
             
             # Clear models from memory if using CUDA
-            if self.device == "cuda" and TORCH_AVAILABLE:
+            if self.device == "cuda":
+                import torch
                 for model in self.models.values():
                     if hasattr(model, 'to'):
                         model.to('cpu')
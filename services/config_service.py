@@ -3,12 +3,19 @@ Configuration Service for PersonalizedReddit
 Manages application configuration and user preferences
 """
 
+import atexit
 import json
 import os
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
+from utils.file_utils import atomic_write_text
 from utils.logging_config import get_logger
 
+# Setting changes made within this window are saved together in one write
+SAVE_DELAY_SECONDS = 0.5
+
 class ConfigService:
     """Simple configuration service"""
     
@@ -25,7 +32,17 @@ class ConfigService:
             'max_posts_per_fetch': 100
         }
         
+        # Pending changes are written by a debounced timer, see set_setting
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        
         self._load_config()
+        
+        # Read-only view for get_setting; set_setting swaps in a new one rather
+        # than mutating, so readers on other threads never need the lock
+        self._snapshot = MappingProxyType(self.settings)
+        atexit.register(self.flush)
     
     def _load_config(self):
         """Load configuration from file"""
@@ -41,23 +58,51 @@ class ConfigService:
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value"""
-        return self.settings.get(key, default)
+        return self._snapshot.get(key, default)
     
     def set_setting(self, key: str, value: Any):
-        """Set a setting value"""
-        self.settings[key] = value
-        self._save_config()
+        """Set a setting value (saved to disk after SAVE_DELAY_SECONDS, or on flush)"""
+        with self._lock:
+            # Copy-on-write: the published settings dict is never mutated in place
+            settings = dict(self.settings)
+            settings[key] = value
+            self.settings = settings
+            self._snapshot = MappingProxyType(settings)
+            self._dirty = True
+            
+            # Restart the countdown so a burst of changes costs a single write
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
     
-    def _save_config(self):
-        """Save configuration to file"""
+    def flush(self):
+        """Write pending setting changes to disk now"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            
+            if self._dirty and self._save_config():
+                self._dirty = False
+    
+    def _save_config(self) -> bool:
+        """Save configuration to file, replacing it atomically"""
         config_file = self.config_dir / "app_config.json"
         try:
-            with open(config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            atomic_write_text(str(config_file), json.dumps(self.settings, indent=2))
             self.logger.debug("Configuration saved")
+            return True
         except Exception as e:
             self.logger.error(f"Failed to save config: {e}")
+            return False
     
     def set_user_preference(self, key: str, value: Any):
         """Set user preference (alias for set_setting)"""
-        self.set_setting(key, value)
\ No newline at end of file
+        self.set_setting(key, value)
+    
+    def close(self):
+        """Save any pending changes"""
+        self.flush()
+        atexit.unregister(self.flush)
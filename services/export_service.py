@@ -4,29 +4,91 @@ Handles data export in multiple formats with professional templates
 """
 
 import csv
+import heapq
+import io
 import json
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    import pandas as pd
-    pandas_available = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    pandas_available = False
+    ORJSON_AVAILABLE = False
+
+try:
+    import xlsxwriter
+    xlsxwriter_available = True
+except ImportError:
+    xlsxwriter_available = False
+
+try:
+    from openpyxl import Workbook
+    openpyxl_available = True
+except ImportError:
+    openpyxl_available = False
 
 try:
     from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib import colors
     reportlab_available = True
 except ImportError:
     reportlab_available = False
 
+from utils.file_utils import WRITE_BUFFER_SIZE, atomic_write_bytes
 from utils.logging_config import get_logger, log_performance
 
+# Rows converted and written per batch, bounding memory on large exports
+EXPORT_CHUNK_SIZE = 10_000
+
+# One business lead in Markdown; optional lines are pre-rendered (or empty) per lead
+_BUSINESS_LEAD_MARKDOWN = (
+    "## {number}. {title}\n\n"
+    "**Subreddit:** r/{subreddit}  \n"
+    "**Author:** u/{author}  \n"
+    "**Business Score:** {score}/10  \n"
+    "**Urgency:** {urgency}  \n"
+    "{keywords}"
+    "**Date:** {date}  \n"
+    "{link}"
+    "{summary}"
+    "---\n\n"
+)
+
+
+def _dumps_cell(value: Any) -> str:
+    """JSON-encode a nested cell value"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value)
+
+
+# CSV cell conversion by exact value type; str, int and float go to the csv
+# module as-is, anything else falls back to _format_csv_value
+_CSV_CELL_FORMATTERS = {
+    str: lambda value: value,
+    int: lambda value: value,
+    float: lambda value: value,
+    list: lambda value: '; '.join(map(str, value)),
+    dict: _dumps_cell,
+}
+
+
+def _format_csv_value(value: Any) -> Any:
+    """Convert a less common cell value (subclasses, None, dates) for CSV"""
+    if isinstance(value, dict):
+        return _dumps_cell(value)
+    if isinstance(value, list):
+        return '; '.join(map(str, value))
+    return str(value)
+
+
 class ExportService:
     """
     Professional data export service supporting multiple formats
@@ -73,43 +135,105 @@ class ExportService:
                 ]
             }
         }
+        
+        # Resolved (columns, headers) per template name, see _resolve_columns
+        self._template_columns: Dict[str, Tuple[List[str], List[str]]] = {}
+        
+        # PDF styles are built once and shared by every PDF export
+        if reportlab_available:
+            self._pdf_styles = getSampleStyleSheet()
+            self._pdf_title_style = ParagraphStyle(
+                'CustomTitle',
+                parent=self._pdf_styles['Heading1'],
+                fontSize=18,
+                spaceAfter=30,
+                textColor=colors.HexColor('#2E4057')
+            )
+            self._pdf_table_style = TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4A90E2')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F9FA')),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD'))
+            ])
+        
+        # Export format -> (writer, file extension); every writer is called as
+        # writer(data, filename, template, chunk_size, export_time) and ignores
+        # the arguments that don't apply to its format
+        self._exporters = {
+            'csv': (self._export_csv, 'csv'),
+            'json': (self._export_json, 'json'),
+            'excel': (self._export_excel, 'xlsx'),
+            'markdown': (self._export_markdown, 'md'),
+            'pdf': (self._export_pdf, 'pdf'),
+            'parquet': (self._export_parquet, 'parquet'),
+            'feather': (self._export_feather, 'feather'),
+        }
+    
+    def _resolve_columns(self, template: Optional[str], data: List[Dict]) -> Tuple[List[str], List[str]]:
+        """
+        Get the columns and headers to export
+        
+        Named templates are resolved once and reused; without a template the
+        columns are every key in data, in first-seen order.
+        
+        Args:
+            template: Template name (may be None or unknown)
+            data: Rows being exported
+        
+        Returns:
+            Tuple of (columns, headers)
+        """
+        resolved = self._template_columns.get(template)
+        if resolved is None and template in self.templates:
+            template_config = self.templates[template]
+            columns = list(template_config['columns'])
+            resolved = (columns, list(template_config.get('headers', columns)))
+            self._template_columns[template] = resolved
+        
+        if resolved is not None:
+            return resolved
+        
+        columns = list(dict.fromkeys(key for row in data for key in row))
+        return columns, columns
     
     @log_performance
-    def export_data(self, data: Union[List[Dict], Dict], filename: str, 
-                   format: str = "csv", template: str = None) -> Path:
+    def export_data(self, data: Union[List[Dict], Dict], filename: str,
+                   format: str = "csv", template: str = None,
+                   chunk_size: int = EXPORT_CHUNK_SIZE) -> Path:
         """
         Export data to specified format
         
         Args:
             data: Data to export (list of dicts or single dict)
             filename: Base filename (without extension)
-            format: Export format (csv, json, excel, markdown, pdf)
+            format: Export format (csv, json, excel, markdown, pdf, parquet, feather)
             template: Template to use for formatting
+            chunk_size: Rows converted and written per batch (row group size for parquet/feather)
             
         Returns:
             Path to exported file
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            if format.lower() == "csv":
-                return self._export_csv(data, f"{filename}_{timestamp}.csv", template)
-            elif format.lower() == "json":
-                return self._export_json(data, f"{filename}_{timestamp}.json")
-            elif format.lower() == "excel":
-                return self._export_excel(data, f"{filename}_{timestamp}.xlsx", template)
-            elif format.lower() == "markdown":
-                return self._export_markdown(data, f"{filename}_{timestamp}.md", template)
-            elif format.lower() == "pdf":
-                return self._export_pdf(data, f"{filename}_{timestamp}.pdf", template)
-            else:
+            exporter = self._exporters.get(format.lower())
+            if exporter is None:
                 raise ValueError(f"Unsupported format: {format}")
+            
+            export, extension = exporter
+            # One clock read names the file and stamps its contents
+            export_time = datetime.now()
+            return export(data, f"{filename}_{export_time:%Y%m%d_%H%M%S}.{extension}",
+                          template, chunk_size, export_time)
                 
         except Exception as e:
             self.logger.error(f"Export failed: {e}", exc_info=True)
             raise
     
-    def _export_csv(self, data: Union[List[Dict], Dict], filename: str, template: str = None) -> Path:
+    def _export_csv(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                    chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
         """Export data to CSV format"""
         filepath = self.export_dir / filename
         
@@ -120,99 +244,190 @@ class ExportService:
         if not data:
             raise ValueError("No data to export")
         
-        # Get template configuration
-        template_config = self.templates.get(template, {})
-        columns = template_config.get('columns', list(data[0].keys()))
-        headers = template_config.get('headers', columns)
+        columns, headers = self._resolve_columns(template, data)
+        
+        formatters = _CSV_CELL_FORMATTERS
+        
+        def to_csv_row(row: Dict) -> List[Any]:
+            cells = []
+            for col in columns:
+                value = row.get(col, '')
+                cells.append(formatters.get(type(value), _format_csv_value)(value))
+            return cells
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
             
             # Write headers
             writer.writerow(headers)
             
-            # Write data rows
-            for row in data:
-                csv_row = []
-                for col in columns:
-                    value = row.get(col, '')
-                    
-                    # Handle list/dict values
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value) if isinstance(value, dict) else '; '.join(map(str, value))
-                    
-                    csv_row.append(str(value))
-                
-                writer.writerow(csv_row)
+            # Write data rows a chunk at a time
+            for start in range(0, len(data), chunk_size):
+                writer.writerows(map(to_csv_row, data[start:start + chunk_size]))
+                csvfile.flush()
         
         self.logger.info(f"Exported {len(data)} records to CSV: {filepath}")
         return filepath
     
-    def _export_json(self, data: Union[List[Dict], Dict], filename: str) -> Path:
+    def _export_json(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                     chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
         """Export data to JSON format"""
         filepath = self.export_dir / filename
+        export_time = export_time or datetime.now()
         
         export_data = {
-            'exported_at': datetime.now().isoformat(),
+            'exported_at': export_time.isoformat(),
             'record_count': len(data) if isinstance(data, list) else 1,
             'data': data
         }
         
-        with open(filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            # Datetimes pass through to default=str so output matches the stdlib path
+            filepath.write_bytes(orjson.dumps(
+                export_data, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME))
+        else:
+            # json.dump() issues a write per token; encode once and write once
+            filepath.write_bytes(
+                json.dumps(export_data, indent=2, ensure_ascii=False, default=str).encode('utf-8'))
         
         self.logger.info(f"Exported data to JSON: {filepath}")
         return filepath
     
-    def _export_excel(self, data: Union[List[Dict], Dict], filename: str, template: str = None) -> Path:
-        """Export data to Excel format"""
-        if not pandas_available:
-            self.logger.warning("Pandas not available, falling back to CSV")
-            return self._export_csv(data, filename.replace('.xlsx', '.csv'), template)
+    def _export_parquet(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                        chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
+        """Export data to Parquet format (zstd-compressed columnar file)"""
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.logger.warning("pyarrow not available, falling back to CSV")
+            return self._export_csv(data, filename.replace('.parquet', '.csv'), template, chunk_size, export_time)
         
         filepath = self.export_dir / filename
+        table = self._to_arrow_table(data, template)
+        pq.write_table(table, filepath, compression='zstd', row_group_size=chunk_size)
+        
+        self.logger.info(f"Exported {table.num_rows} records to Parquet: {filepath}")
+        return filepath
+    
+    def _export_feather(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                        chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
+        """Export data to Feather format (lz4-compressed Arrow IPC file)"""
+        try:
+            import pyarrow.feather as feather
+        except ImportError:
+            self.logger.warning("pyarrow not available, falling back to CSV")
+            return self._export_csv(data, filename.replace('.feather', '.csv'), template, chunk_size, export_time)
+        
+        filepath = self.export_dir / filename
+        table = self._to_arrow_table(data, template)
+        feather.write_feather(table, filepath, compression='lz4', chunksize=chunk_size)
+        
+        self.logger.info(f"Exported {table.num_rows} records to Feather: {filepath}")
+        return filepath
+    
+    def _to_arrow_table(self, data: Union[List[Dict], Dict], template: str = None):
+        """Build a pyarrow Table, one column per template column (or data key)"""
+        import pyarrow as pa
         
-        # Convert to DataFrame
         if isinstance(data, dict):
             data = [data]
         
-        df = pd.DataFrame(data)
+        if not data:
+            raise ValueError("No data to export")
         
-        # Apply template if specified
-        template_config = self.templates.get(template, {})
-        if template_config:
-            columns = template_config.get('columns', df.columns)
-            headers = template_config.get('headers', columns)
-            
-            # Reorder columns and rename headers
-            df = df[columns] if all(col in df.columns for col in columns) else df
-            df.columns = headers[:len(df.columns)]
+        columns, _ = self._resolve_columns(template, data)
+        
+        arrays = {}
+        for col in columns:
+            values = [row.get(col) for row in data]
+            try:
+                arrays[col] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type column: store the same text the CSV export writes
+                arrays[col] = pa.array([
+                    None if value is None else str(_CSV_CELL_FORMATTERS.get(type(value), _format_csv_value)(value))
+                    for value in values
+                ])
+        return pa.table(arrays)
+    
+    def _export_excel(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
+        """Export data to Excel format (xlsxwriter if installed, else openpyxl)"""
+        if not (xlsxwriter_available or openpyxl_available):
+            self.logger.warning("xlsxwriter/openpyxl not available, falling back to CSV")
+            return self._export_csv(data, filename.replace('.xlsx', '.csv'), template, chunk_size, export_time)
+        
+        filepath = self.export_dir / filename
+        
+        if isinstance(data, dict):
+            data = [data]
+        
+        columns, headers = self._resolve_columns(template, data)
+        
+        formatters = _CSV_CELL_FORMATTERS
         
-        # Export with formatting
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Data')
+        def to_excel_row(row: Dict) -> List[Any]:
+            cells = []
+            for col in columns:
+                value = row.get(col)
+                cells.append(None if value is None else formatters.get(type(value), _format_csv_value)(value))
+            return cells
+        
+        data_rows = (
+            excel_row
+            for start in range(0, len(data), chunk_size)
+            for excel_row in map(to_excel_row, data[start:start + chunk_size])
+        )
+        metadata_rows = [
+            ['Property', 'Value'],
+            ['Export Date', (export_time or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')],
+            ['Record Count', len(data)],
+            ['Template Used', template or 'None'],
+        ]
+        
+        if xlsxwriter_available:
+            # constant_memory flushes each row to disk once the next one starts
+            workbook = xlsxwriter.Workbook(str(filepath), {'constant_memory': True})
+            sheet = workbook.add_worksheet('Data')
+            sheet.write_row(0, 0, headers)
+            for row_number, excel_row in enumerate(data_rows, 1):
+                sheet.write_row(row_number, 0, excel_row)
             
-            # Add metadata sheet
-            metadata = pd.DataFrame({
-                'Property': ['Export Date', 'Record Count', 'Template Used'],
-                'Value': [datetime.now().strftime('%Y-%m-%d %H:%M:%S'), len(data), template or 'None']
-            })
-            metadata.to_excel(writer, index=False, sheet_name='Metadata')
+            metadata = workbook.add_worksheet('Metadata')
+            for row_number, metadata_row in enumerate(metadata_rows):
+                metadata.write_row(row_number, 0, metadata_row)
+            workbook.close()
+        else:
+            # Write-only workbooks stream rows out instead of keeping a cell object per value
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet('Data')
+            sheet.append(headers)
+            for excel_row in data_rows:
+                sheet.append(excel_row)
+            
+            metadata = workbook.create_sheet('Metadata')
+            for metadata_row in metadata_rows:
+                metadata.append(metadata_row)
+            workbook.save(filepath)
         
         self.logger.info(f"Exported {len(data)} records to Excel: {filepath}")
         return filepath
-    
-    def _export_markdown(self, data: Union[List[Dict], Dict], filename: str, template: str = None) -> Path:
+
+    def _export_markdown(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                         chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
         """Export data to Markdown format"""
         filepath = self.export_dir / filename
+        export_time = export_time or datetime.now()
         
         if isinstance(data, dict):
             data = [data]
         
-        with open(filepath, 'w', encoding='utf-8') as mdfile:
+        with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as mdfile:
             # Write header
             mdfile.write(f"# {filename.replace('.md', '').replace('_', ' ').title()}\n\n")
-            mdfile.write(f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            mdfile.write(f"**Exported:** {export_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             mdfile.write(f"**Total Records:** {len(data)}\n\n")
             mdfile.write("---\n\n")
             
@@ -230,173 +445,152 @@ class ExportService:
         return filepath
     
     def _write_business_leads_markdown(self, file, data: List[Dict]):
-        """Write business leads in Markdown format"""
+        """Write business leads in Markdown format, one write per lead"""
+        write = file.write
+        render = _BUSINESS_LEAD_MARKDOWN.format
         for i, lead in enumerate(data, 1):
-            file.write(f"## {i}. {lead.get('title', 'Untitled')}\n\n")
-            file.write(f"**Subreddit:** r/{lead.get('subreddit', 'unknown')}  \n")
-            file.write(f"**Author:** u/{lead.get('author', 'unknown')}  \n")
-            file.write(f"**Business Score:** {lead.get('business_score', 0)}/10  \n")
-            file.write(f"**Urgency:** {lead.get('urgency_level', 'low').title()}  \n")
-            
-            if lead.get('problem_indicators'):
-                indicators = lead['problem_indicators']
-                if isinstance(indicators, list):
-                    file.write(f"**Keywords:** {', '.join(indicators)}  \n")
-                else:
-                    file.write(f"**Keywords:** {indicators}  \n")
-            
-            file.write(f"**Date:** {lead.get('created_date', 'Unknown')}  \n")
-            
-            if lead.get('permalink'):
-                file.write(f"**Link:** {lead['permalink']}\n\n")
-            
-            if lead.get('summary'):
-                file.write(f"**Summary:**\n{lead['summary']}\n\n")
+            indicators = lead.get('problem_indicators')
+            if isinstance(indicators, list):
+                indicators = ', '.join(indicators)
             
-            file.write("---\n\n")
+            write(render(
+                number=i,
+                title=lead.get('title', 'Untitled'),
+                subreddit=lead.get('subreddit', 'unknown'),
+                author=lead.get('author', 'unknown'),
+                score=lead.get('business_score', 0),
+                urgency=lead.get('urgency_level', 'low').title(),
+                keywords=f"**Keywords:** {indicators}  \n" if indicators else "",
+                date=lead.get('created_date', 'Unknown'),
+                link=f"**Link:** {lead['permalink']}\n\n" if lead.get('permalink') else "",
+                summary=f"**Summary:**\n{lead['summary']}\n\n" if lead.get('summary') else "",
+            ))
     
     def _write_newsletter_markdown(self, file, data: List[Dict]):
-        """Write newsletter digest in Markdown format"""
-        # Group by priority
-        high_priority = [d for d in data if d.get('priority') == 'high']
-        medium_priority = [d for d in data if d.get('priority') == 'medium']
-        low_priority = [d for d in data if d.get('priority') == 'low']
-        
-        for priority_name, items in [('High Priority', high_priority), 
-                                   ('Medium Priority', medium_priority), 
-                                   ('Low Priority', low_priority)]:
+        """Write newsletter digest in Markdown format, one write per item"""
+        # Group by priority in one pass; items without a known priority are skipped
+        buckets = {'high': [], 'medium': [], 'low': []}
+        for item in data:
+            bucket = buckets.get(item.get('priority'))
+            if bucket is not None:
+                bucket.append(item)
+        
+        write = file.write
+        for priority_name, items in [('High Priority', buckets['high']),
+                                   ('Medium Priority', buckets['medium']),
+                                   ('Low Priority', buckets['low'])]:
             if items:
-                file.write(f"## {priority_name} Opportunities\n\n")
+                write(f"## {priority_name} Opportunities\n\n")
                 for item in items:
-                    file.write(f"### {item.get('title', 'Untitled')}\n")
-                    file.write(f"**Source:** r/{item.get('subreddit')} | ")
-                    file.write(f"**Score:** {item.get('business_score', 0)} | ")
-                    file.write(f"**Engagement:** {item.get('engagement_score', 0)}\n\n")
-                    
-                    if item.get('summary'):
-                        file.write(f"{item['summary']}\n\n")
-                    
-                    file.write("---\n\n")
+                    summary = item.get('summary')
+                    write(''.join([
+                        f"### {item.get('title', 'Untitled')}\n",
+                        f"**Source:** r/{item.get('subreddit')} | ",
+                        f"**Score:** {item.get('business_score', 0)} | ",
+                        f"**Engagement:** {item.get('engagement_score', 0)}\n\n",
+                        f"{summary}\n\n" if summary else "",
+                        "---\n\n",
+                    ]))
     
     def _write_recommendations_markdown(self, file, data: List[Dict]):
-        """Write subreddit recommendations in Markdown format"""
+        """Write subreddit recommendations in Markdown format, one write per subreddit"""
+        write = file.write
         for rec in data:
-            file.write(f"## r/{rec.get('subreddit', 'unknown')}\n\n")
-            file.write(f"**Category:** {rec.get('category', 'Unknown')}  \n")
-            file.write(f"**Match Score:** {rec.get('match_percentage', 0)}%  \n")
-            file.write(f"**Members:** {rec.get('members', 'Unknown')}  \n")
-            file.write(f"**Activity Level:** {rec.get('activity_level', 'Unknown')}  \n")
-            
-            if rec.get('explanation'):
-                file.write(f"**Why Recommended:** {rec['explanation']}  \n")
-            
-            file.write("\n---\n\n")
-    
+            explanation = rec.get('explanation')
+            write(''.join([
+                f"## r/{rec.get('subreddit', 'unknown')}\n\n",
+                f"**Category:** {rec.get('category', 'Unknown')}  \n",
+                f"**Match Score:** {rec.get('match_percentage', 0)}%  \n",
+                f"**Members:** {rec.get('members', 'Unknown')}  \n",
+                f"**Activity Level:** {rec.get('activity_level', 'Unknown')}  \n",
+                f"**Why Recommended:** {explanation}  \n" if explanation else "",
+                "\n---\n\n",
+            ]))
+
     def _write_generic_markdown(self, file, data: List[Dict]):
         """Write generic data in Markdown table format"""
         if not data:
             return
         
-        # Get all unique keys
-        all_keys = set()
-        for item in data:
-            all_keys.update(item.keys())
-        
-        keys = sorted(list(all_keys))
+        # Get all unique keys; union() walks every dict's keys in C
+        keys = sorted(set().union(*data))
         
         # Write table header
         file.write("| " + " | ".join(keys) + " |\n")
         file.write("| " + " | ".join(["---"] * len(keys)) + " |\n")
         
         # Write data rows
+        write = file.write
         for item in data:
             row = []
             for key in keys:
                 value = item.get(key, '')
-                if isinstance(value, (list, dict)):
-                    value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-                row.append(str(value))
-            file.write("| " + " | ".join(row) + " |\n")
+                text = str(value)
+                if isinstance(value, (list, dict)) and len(text) > 50:
+                    text = text[:50] + "..."
+                row.append(text)
+            write(f"| {' | '.join(row)} |\n")
     
-    def _export_pdf(self, data: Union[List[Dict], Dict], filename: str, template: str = None) -> Path:
+    def _export_pdf(self, data: Union[List[Dict], Dict], filename: str, template: str = None,
+                    chunk_size: int = EXPORT_CHUNK_SIZE, export_time: Optional[datetime] = None) -> Path:
         """Export data to PDF format"""
         if not reportlab_available:
             self.logger.warning("ReportLab not available, falling back to Markdown")
-            return self._export_markdown(data, filename.replace('.pdf', '.md'), template)
+            return self._export_markdown(data, filename.replace('.pdf', '.md'), template, chunk_size, export_time)
         
         filepath = self.export_dir / filename
         
-        # Create PDF document
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter)
-        styles = getSampleStyleSheet()
+        # Create PDF document; it is rendered in memory and written out in one go
+        pdf_buffer = io.BytesIO()
+        doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
         story = []
         
         # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=30,
-            textColor=colors.HexColor('#2E4057')
-        )
-        
         title = filename.replace('.pdf', '').replace('_', ' ').title()
-        story.append(Paragraph(title, title_style))
+        story.append(Paragraph(title, self._pdf_title_style))
         story.append(Spacer(1, 12))
         
         # Metadata
         metadata_text = f"""
-        <b>Export Date:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>
+        <b>Export Date:</b> {(export_time or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}<br/>
         <b>Record Count:</b> {len(data) if isinstance(data, list) else 1}<br/>
         <b>Template:</b> {template or 'Generic'}
         """
-        story.append(Paragraph(metadata_text, styles['Normal']))
+        story.append(Paragraph(metadata_text, self._pdf_styles['Normal']))
         story.append(Spacer(1, 20))
         
         if isinstance(data, dict):
             data = [data]
         
         # Create table data
-        if template and template in self.templates:
-            template_config = self.templates[template]
-            columns = template_config['columns']
-            headers = template_config['headers']
-        else:
-            columns = list(data[0].keys()) if data else []
-            headers = columns
+        columns, headers = self._resolve_columns(template, data)
         
-        table_data = [headers]
-        
-        for row in data:
-            table_row = []
-            for col in columns:
-                value = row.get(col, '')
-                if isinstance(value, (list, dict)):
-                    value = json.dumps(value)[:50] + "..." if len(json.dumps(value)) > 50 else json.dumps(value)
+        # One table per chunk keeps layout work bounded; LongTable repeats
+        # the header row on every page a chunk spans
+        for start in range(0, len(data), chunk_size):
+            table_data = [headers]
+            
+            for row in data[start:start + chunk_size]:
+                table_row = []
+                for col in columns:
+                    value = row.get(col, '')
+                    if isinstance(value, (list, dict)):
+                        encoded = _dumps_cell(value)
+                        value = encoded[:50] + "..." if len(encoded) > 50 else encoded
+                    
+                    # Truncate long text
+                    text = str(value)
+                    table_row.append(text[:100] + "..." if len(text) > 100 else text)
                 
-                # Truncate long text
-                value = str(value)[:100] + "..." if len(str(value)) > 100 else str(value)
-                table_row.append(value)
+                table_data.append(table_row)
             
-            table_data.append(table_row)
-        
-        # Create and style table
-        table = Table(table_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4A90E2')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F9FA')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD'))
-        ]))
-        
-        story.append(table)
+            table = LongTable(table_data, repeatRows=1)
+            table.setStyle(self._pdf_table_style)
+            story.append(table)
         
         # Build PDF
         doc.build(story)
+        atomic_write_bytes(str(filepath), pdf_buffer.getvalue())
         
         self.logger.info(f"Exported {len(data)} records to PDF: {filepath}")
         return filepath
@@ -415,6 +609,29 @@ class ExportService:
         """Export subreddit recommendations"""
         return self.export_data(recommendations, "subreddit_recommendations", format, "subreddit_recommendations")
     
+    def export_all(self, bundles: Dict[str, Tuple[Union[List[Dict], Dict], str, Optional[str]]]) -> Dict[str, Path]:
+        """
+        Export several datasets concurrently
+        
+        Each bundle writes its own file, and the writers spend most of their
+        time in file I/O and C code, so they overlap well on threads.
+        
+        Args:
+            bundles: Base filename -> (data, format, template)
+        
+        Returns:
+            Base filename -> path of the exported file
+        """
+        if not bundles:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(bundles), 4)) as executor:
+            futures = {
+                name: executor.submit(self.export_data, data, name, format, template)
+                for name, (data, format, template) in bundles.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+    
     def get_export_history(self, days: int = 30) -> List[Dict]:
         """Get export history from database"""
         if self.database:
@@ -425,35 +642,41 @@ class ExportService:
             except Exception as e:
                 self.logger.error(f"Failed to get export history: {e}")
         
-        # Return list of recent exports in the directory
-        exports = []
-        for file_path in self.export_dir.iterdir():
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                stat = file_path.stat()
-                exports.append({
-                    'filename': file_path.name,
-                    'format': file_path.suffix[1:],
-                    'size_bytes': stat.st_size,
-                    'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    'file_path': str(file_path)
-                })
-        
-        # Sort by creation time, most recent first
-        exports.sort(key=lambda x: x['created_at'], reverse=True)
-        return exports[:50]  # Limit to 50 recent exports
+        # scandir entries carry their stat results, so each file costs one syscall at most
+        with os.scandir(self.export_dir) as entries:
+            files = [
+                (entry, entry.stat())
+                for entry in entries
+                if not entry.name.startswith('.') and entry.is_file()
+            ]
+        
+        # Pick the 50 most recent by raw ctime, then build records for just those
+        recent = heapq.nlargest(50, files, key=lambda item: item[1].st_ctime)
+        return [
+            {
+                'filename': entry.name,
+                'format': os.path.splitext(entry.name)[1][1:],
+                'size_bytes': stat.st_size,
+                'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                'file_path': str(self.export_dir / entry.name)
+            }
+            for entry, stat in recent
+        ]
     
     def cleanup_old_exports(self, days: int = 30) -> int:
         """Clean up old export files"""
         cutoff_time = datetime.now().timestamp() - (days * 24 * 60 * 60)
         deleted_count = 0
         
-        for file_path in self.export_dir.iterdir():
-            if file_path.is_file() and file_path.stat().st_ctime < cutoff_time:
-                try:
-                    file_path.unlink()
-                    deleted_count += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to delete {file_path}: {e}")
+        # scandir entries carry their stat results, and os.unlink skips Path objects
+        with os.scandir(self.export_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_ctime < cutoff_time:
+                    try:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                    except Exception as e:
+                        self.logger.error(f"Failed to delete {entry.path}: {e}")
         
         self.logger.info(f"Cleaned up {deleted_count} old export files")
         return deleted_count
@@ -3,20 +3,45 @@ Live Reddit Service for PersonalizedReddit
 Provides real-time Reddit monitoring and enhanced post interaction capabilities
 """
 
+import heapq
+import os
+import random
 import time
 import threading
-from datetime import datetime, timedelta
+from collections import Counter, OrderedDict
+from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import queue
 
 from utils.logging_config import get_logger, log_performance
 
+# Fetched posts waiting for analysis; new posts are dropped once this fills up
+FETCH_QUEUE_SIZE = 200
+
+# Longest wait between fetch attempts while Reddit keeps failing (seconds)
+MAX_FETCH_BACKOFF = 300
+
 class LiveRedditService:
     """
     Service for real-time Reddit monitoring and enhanced post interactions
     """
     
+    # get_posts_by_filter: which recent posts each filter keeps ('high_priority'
+    # comes straight from the priority index)...
+    _POST_FILTERS = {
+        'business': lambda p: p.get('business_score', 0) >= 3.0,
+        'automation': lambda p: 'automation' in p.get('automation_keywords', []),
+    }
+    
+    # ...and how they are ranked (anything else ranks by business score)
+    _POST_SORT_KEYS = {
+        'hot': itemgetter('score'),
+        'new': itemgetter('created_utc'),
+        'top': lambda x: x['score'] + x['num_comments'],
+    }
+    
     def __init__(self, reddit_service, ai_service, database):
         self.reddit_service = reddit_service
         self.ai_service = ai_service
@@ -26,8 +51,18 @@ class LiveRedditService:
         # Live monitoring state
         self.is_monitoring = False
         self.monitoring_thread = None
+        self.analysis_thread = None
+        # Each start gets a fresh event, so threads that outlive a stop's join
+        # timeout still see their own run as stopped after a restart
+        self._stop_event = threading.Event()
         self.update_callbacks = []
         
+        # Fetching and analysis run on separate threads joined by a bounded
+        # queue, so a slow AI backend can't pile up posts without limit
+        self._fetch_queue: queue.Queue = queue.Queue(maxsize=FETCH_QUEUE_SIZE)
+        self._pending_ids = set()
+        self.dropped_posts = 0
+        
         # Configuration
         self.config = {
             'update_interval': 30,  # seconds
@@ -39,11 +74,31 @@ class LiveRedditService:
             ]
         }
         
-        # Cache for recent posts
+        # Cache for recent posts, oldest first; _expiry holds each post's
+        # time.monotonic() deadline so eviction only ever looks at the head
         self.recent_posts = []
-        self.post_cache = {}
+        self.post_cache: OrderedDict = OrderedDict()
+        self._expiry: Dict[str, float] = {}
+        self.cache_ttl = 24 * 3600
         self.last_update = None
         
+        # Guards post_cache, _expiry, _pending_ids and the recent_posts views.
+        # recent_posts and its index are replaced rather than mutated, so
+        # readers only hold the lock long enough to take references
+        self._cache_lock = threading.Lock()
+        
+        # Per-priority views of recent_posts, rebuilt once per cache update
+        self._priority_counts: Counter = Counter()
+        self._business_score_sum = 0.0
+        self._by_priority: Dict[str, List[Dict]] = {}
+        # Ranked results per filter type, valid until the next cache update
+        self._filtered_posts: Dict[str, List[Dict]] = {}
+        
+        # Long-lived pool for post analysis, shared by every monitoring tick. The
+        # work is I/O-bound (AI service calls), so size it past the core count
+        self.max_workers = int(os.getenv('LIVE_REDDIT_WORKERS') or min(32, (os.cpu_count() or 1) + 4))
+        self._ai_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='live-reddit')
+        
     @log_performance
     def start_live_monitoring(self, callback: Optional[Callable] = None):
         """
@@ -58,15 +113,23 @@ class LiveRedditService:
         
         try:
             self.is_monitoring = True
+            stop_event = self._stop_event = threading.Event()
             if callback:
                 self.update_callbacks.append(callback)
             
-            # Start monitoring thread
+            # Start fetch and analysis threads
             self.monitoring_thread = threading.Thread(
                 target=self._monitoring_loop,
+                args=(stop_event,),
+                daemon=True
+            )
+            self.analysis_thread = threading.Thread(
+                target=self._analysis_loop,
+                args=(stop_event,),
                 daemon=True
             )
             self.monitoring_thread.start()
+            self.analysis_thread.start()
             
             self.logger.info("Live Reddit monitoring started")
             
@@ -81,37 +144,82 @@ class LiveRedditService:
             return
         
         self.is_monitoring = False
+        self._stop_event.set()
         
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=5)
+        for thread in (self.monitoring_thread, self.analysis_thread):
+            if thread and thread.is_alive():
+                thread.join(timeout=5)
         
         self.logger.info("Live Reddit monitoring stopped")
     
-    def _monitoring_loop(self):
-        """Main monitoring loop"""
-        while self.is_monitoring:
+    def _monitoring_loop(self, stop_event: threading.Event):
+        """Main monitoring loop: fetch new posts and queue them for analysis until stop_event is set"""
+        failures = 0
+        while not stop_event.is_set():
             try:
                 # Fetch new posts
+                dropped = 0
                 new_posts = self._fetch_recent_posts()
+                with self._cache_lock:
+                    for post in new_posts:
+                        self._pending_ids.add(post.id)
+                        try:
+                            self._fetch_queue.put_nowait(post)
+                        except queue.Full:
+                            # Not cached or pending, so a later fetch can pick it up again
+                            self._pending_ids.discard(post.id)
+                            dropped += 1
                 
-                if new_posts:
-                    # Process posts for business opportunities
-                    processed_posts = self._process_posts_for_opportunities(new_posts)
-                    
-                    # Update cache
-                    self._update_post_cache(processed_posts)
-                    
-                    # Notify callbacks
-                    self._notify_callbacks(processed_posts)
-                    
-                    self.last_update = datetime.now()
-                
-                # Wait for next update
-                time.sleep(self.config['update_interval'])
+                if dropped:
+                    self.dropped_posts += dropped
+                    self.logger.warning(f"Analysis queue full, dropped {dropped} posts")
                 
+                failures = 0
+                delay = self.config['update_interval']
+            
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.config['update_interval'])
+                
+                # Back off exponentially, with jitter, while errors persist
+                failures += 1
+                delay = min(MAX_FETCH_BACKOFF,
+                            self.config['update_interval'] * 2 ** (failures - 1) + random.uniform(0, 1))
+            
+            # Wait for next update; stop_live_monitoring wakes this immediately
+            if stop_event.wait(delay):
+                break
+    
+    def _analysis_loop(self, stop_event: threading.Event):
+        """Analysis loop: process queued posts in batches as they arrive until stop_event is set"""
+        while not stop_event.is_set():
+            try:
+                batch = [self._fetch_queue.get(timeout=1)]
+            except queue.Empty:
+                continue
+            
+            while len(batch) < self.config['max_posts_per_fetch']:
+                try:
+                    batch.append(self._fetch_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                # Process posts for business opportunities
+                processed_posts = self._process_posts_for_opportunities(batch)
+                
+                # Update cache
+                self._update_post_cache(processed_posts)
+                
+                # Notify callbacks
+                self._notify_callbacks(processed_posts)
+                
+                self.last_update = datetime.now()
+            
+            except Exception as e:
+                self.logger.error(f"Error in analysis loop: {e}")
+            finally:
+                with self._cache_lock:
+                    self._pending_ids.difference_update(post.id for post in batch)
     
     def _fetch_recent_posts(self) -> List[Any]:
         """Fetch recent posts from monitored subreddits"""
@@ -121,101 +229,106 @@ class LiveRedditService:
                 limit=self.config['max_posts_per_fetch']
             )
             
-            # Filter out posts we've already seen
-            filtered_posts = []
-            for post in new_posts:
-                if post.id not in self.post_cache:
-                    filtered_posts.append(post)
+            # Filter out posts we've already seen or queued
+            with self._cache_lock:
+                post_cache, pending_ids = self.post_cache, self._pending_ids
+                filtered_posts = [
+                    post for post in new_posts
+                    if post.id not in post_cache and post.id not in pending_ids
+                ]
             
             self.logger.debug(f"Fetched {len(filtered_posts)} new posts")
             return filtered_posts
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to fetch recent posts: {e}")
-            return []
+            raise
     
     def _process_posts_for_opportunities(self, posts: List[Any]) -> List[Dict[str, Any]]:
         """Process posts to identify business opportunities"""
-        processed_posts = []
+        # One timestamp for the whole batch rather than a clock read per post
+        analyzed_at = datetime.now().isoformat()
         
-        # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_post = {
-                executor.submit(self._analyze_single_post, post): post 
-                for post in posts
-            }
-            
-            for future in as_completed(future_to_post):
-                post = future_to_post[future]
-                try:
-                    analysis_result = future.result()
-                    if analysis_result:
-                        processed_posts.append(analysis_result)
-                except Exception as e:
-                    self.logger.error(f"Failed to analyze post {post.id}: {e}")
+        # Combine title and content for analysis
+        texts = [f"{post.title}\n\n{getattr(post, 'selftext', '')}" for post in posts]
+        
+        # Keyword matching alone bounds the score, so posts that can't reach the
+        # threshold are dropped before any model runs
+        threshold = self.config['business_score_threshold']
+        prefiltered = [
+            (post, full_text) for post, full_text in zip(posts, texts)
+            if self.ai_service.opportunity_score_upper_bound(full_text) >= threshold
+        ]
+        if not prefiltered:
+            return []
+        posts, texts = map(list, zip(*prefiltered))
+        
+        # Score the rest in one call; skip posts with low business scores
+        candidates = [
+            (post, full_text, ai_analysis)
+            for post, full_text, ai_analysis in zip(
+                posts, texts, self.ai_service.detect_business_opportunities_batch(texts)
+            )
+            if ai_analysis.get('opportunity_score', 0) >= threshold
+        ]
+        if not candidates:
+            return []
+        
+        # Summaries have no batch API, so they run on the pool while sentiment
+        # is analyzed in one batched call (mostly cache hits from the scoring step)
+        summary_futures = [
+            self._ai_pool.submit(self.ai_service.summarize_text, full_text, max_length=100)
+            for _, full_text, _ in candidates
+        ]
+        sentiments = self.ai_service.analyze_sentiment_batch([full_text for _, full_text, _ in candidates])
+        
+        processed_posts = []
+        for (post, full_text, ai_analysis), sentiment, summary_future in zip(candidates, sentiments, summary_futures):
+            try:
+                processed_posts.append(self._build_processed_post(
+                    post, full_text, ai_analysis, summary_future.result(), sentiment, analyzed_at
+                ))
+            except Exception as e:
+                self.logger.error(f"Failed to analyze post {post.id}: {e}")
         
         # Sort by business score
         processed_posts.sort(
-            key=lambda x: x.get('business_score', 0), 
+            key=itemgetter('business_score'), 
             reverse=True
         )
         
         return processed_posts
     
-    def _analyze_single_post(self, post) -> Optional[Dict[str, Any]]:
-        """Analyze a single post for business opportunities"""
-        try:
-            # Combine title and content for analysis
-            full_text = f"{post.title}\n\n{getattr(post, 'selftext', '')}"
-            
-            # AI analysis for business opportunities
-            ai_analysis = self.ai_service.detect_business_opportunities(full_text)
-            
-            # Skip posts with low business scores
-            if ai_analysis.get('opportunity_score', 0) < self.config['business_score_threshold']:
-                return None
-            
-            # Generate summary
-            summary = self.ai_service.summarize_text(full_text, max_length=100)
-            
-            # Analyze sentiment
-            sentiment = self.ai_service.analyze_sentiment(full_text)
-            
-            # Create processed post data
-            processed_post = {
-                'id': post.id,
-                'title': post.title,
-                'author': str(post.author) if post.author else '[deleted]',
-                'subreddit': str(post.subreddit),
-                'url': f"https://reddit.com{post.permalink}",
-                'score': post.score,
-                'num_comments': post.num_comments,
-                'created_utc': post.created_utc,
-                'time_ago': self._time_ago(post.created_utc),
-                
-                # AI analysis results
-                'business_score': ai_analysis.get('opportunity_score', 0),
-                'priority': self._calculate_priority(ai_analysis),
-                'problem_indicators': ai_analysis.get('keywords_found', {}),
-                'automation_keywords': ai_analysis.get('categories', []),
-                'urgency_level': ai_analysis.get('urgency_level', 'low'),
-                'sentiment': sentiment,
-                
-                # Summary and content
-                'summary': summary.get('summary', ''),
-                'content_preview': full_text[:300] + "..." if len(full_text) > 300 else full_text,
-                'full_content': full_text,
-                
-                # Metadata
-                'analyzed_at': datetime.now().isoformat(),
-                'analysis_confidence': ai_analysis.get('confidence', 0)
-            }
+    def _build_processed_post(self, post, full_text: str, ai_analysis: Dict, summary: Dict,
+                              sentiment: Dict, analyzed_at: str) -> Dict[str, Any]:
+        """Combine a post and its AI analysis results into processed post data"""
+        return {
+            'id': post.id,
+            'title': post.title,
+            'author': str(post.author) if post.author else '[deleted]',
+            'subreddit': str(post.subreddit),
+            'url': f"https://reddit.com{post.permalink}",
+            'score': post.score,
+            'num_comments': post.num_comments,
+            'created_utc': post.created_utc,
             
-            return processed_post
+            # AI analysis results
+            'business_score': ai_analysis.get('opportunity_score', 0),
+            'priority': self._calculate_priority(ai_analysis),
+            'problem_indicators': ai_analysis.get('keywords_found', {}),
+            'automation_keywords': ai_analysis.get('categories', []),
+            'urgency_level': ai_analysis.get('urgency_level', 'low'),
+            'sentiment': sentiment,
             
-        except Exception as e:
-            self.logger.error(f"Failed to analyze post {post.id}: {e}")
-            return None
+            # Summary and content
+            'summary': summary.get('summary', ''),
+            'content_preview': full_text[:300] + "..." if len(full_text) > 300 else full_text,
+            'full_content': full_text,
+            
+            # Metadata
+            'analyzed_at': analyzed_at,
+            'analysis_confidence': ai_analysis.get('confidence', 0)
+        }
     
     def _calculate_priority(self, ai_analysis: Dict) -> str:
         """Calculate priority level based on AI analysis"""
@@ -232,48 +345,68 @@ class LiveRedditService:
     def _time_ago(self, created_utc: float) -> str:
         """Convert UTC timestamp to 'time ago' string"""
         try:
-            created_time = datetime.fromtimestamp(created_utc)
-            now = datetime.now()
-            diff = now - created_time
-            
-            if diff.days > 0:
-                return f"{diff.days} days ago"
-            elif diff.seconds > 3600:
-                hours = diff.seconds // 3600
-                return f"{hours} hours ago"
-            elif diff.seconds > 60:
-                minutes = diff.seconds // 60
-                return f"{minutes} minutes ago"
+            seconds = int(time.time() - created_utc)
+            
+            if seconds >= 86400:
+                return f"{seconds // 86400} days ago"
+            elif seconds > 3600:
+                return f"{seconds // 3600} hours ago"
+            elif seconds > 60:
+                return f"{seconds // 60} minutes ago"
             else:
                 return "just now"
-                
+        
         except Exception:
             return "unknown"
     
+    def _with_time_ago(self, posts: List[Dict]) -> List[Dict]:
+        """Copy posts for callers, adding a 'time_ago' that is current as of now"""
+        return [{**post, 'time_ago': self._time_ago(post['created_utc'])} for post in posts]
+    
     def _update_post_cache(self, posts: List[Dict]):
         """Update the post cache with new posts"""
-        for post in posts:
-            self.post_cache[post['id']] = post
-        
-        # Keep only recent posts (last 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        self.post_cache = {
-            post_id: post for post_id, post in self.post_cache.items()
-            if datetime.fromisoformat(post['analyzed_at'].replace('Z', '+00:00')) > cutoff_time
-        }
+        with self._cache_lock:
+            now = time.monotonic()
+            for post in posts:
+                self.post_cache[post['id']] = post
+                self.post_cache.move_to_end(post['id'])
+                self._expiry[post['id']] = now + self.cache_ttl
+            
+            # Keep only recent posts (last 24 hours); entries expire in insertion order
+            evicted = False
+            while self.post_cache:
+                oldest_id = next(iter(self.post_cache))
+                if self._expiry[oldest_id] > now:
+                    break
+                self.post_cache.popitem(last=False)
+                del self._expiry[oldest_id]
+                evicted = True
+            
+            # Update recent posts list (last 100 by creation time). Without evictions
+            # the new top 100 can only come from the old top 100 plus the new posts
+            if evicted:
+                candidates = self.post_cache.values()
+            else:
+                candidates = self.recent_posts + posts
+            self.recent_posts = heapq.nlargest(100, candidates, key=itemgetter('created_utc'))
+            self._index_recent_posts()
+    
+    def _index_recent_posts(self):
+        """Rebuild the priority index and stats totals over recent_posts (hold _cache_lock)"""
+        by_priority = {}
+        for post in self.recent_posts:
+            by_priority.setdefault(post.get('priority'), []).append(post)
         
-        # Update recent posts list
-        self.recent_posts = sorted(
-            self.post_cache.values(),
-            key=lambda x: x['created_utc'],
-            reverse=True
-        )[:100]  # Keep last 100 posts
+        self._by_priority = by_priority
+        self._priority_counts = Counter({priority: len(posts) for priority, posts in by_priority.items()})
+        self._business_score_sum = sum(p.get('business_score', 0) for p in self.recent_posts)
+        self._filtered_posts = {}
     
     def _notify_callbacks(self, new_posts: List[Dict]):
         """Notify registered callbacks about new posts"""
         for callback in self.update_callbacks:
             try:
-                callback(new_posts)
+                callback(self._with_time_ago(new_posts))
             except Exception as e:
                 self.logger.error(f"Callback notification failed: {e}")
     
@@ -287,7 +420,9 @@ class LiveRedditService:
         Returns:
             List of processed post dictionaries
         """
-        return self.recent_posts[:limit]
+        with self._cache_lock:
+            posts = self.recent_posts[:limit]
+        return self._with_time_ago(posts)
     
     def get_posts_by_filter(self, filter_type: str, limit: int = 50) -> List[Dict]:
         """
@@ -297,27 +432,31 @@ class LiveRedditService:
             filter_type: Type of filter ('hot', 'new', 'top', 'business', etc.)
             limit: Maximum number of posts to return
         """
-        posts = self.recent_posts.copy()
-        
-        if filter_type == 'business':
-            # Filter for high business scores
-            posts = [p for p in posts if p.get('business_score', 0) >= 3.0]
-        elif filter_type == 'high_priority':
-            posts = [p for p in posts if p.get('priority') == 'high']
-        elif filter_type == 'automation':
-            posts = [p for p in posts if 'automation' in p.get('automation_keywords', [])]
-        
-        # Sort based on filter type
-        if filter_type == 'hot':
-            posts.sort(key=lambda x: x.get('score', 0), reverse=True)
-        elif filter_type == 'new':
-            posts.sort(key=lambda x: x.get('created_utc', 0), reverse=True)
-        elif filter_type == 'top':
-            posts.sort(key=lambda x: x.get('score', 0) + x.get('num_comments', 0), reverse=True)
-        else:
-            posts.sort(key=lambda x: x.get('business_score', 0), reverse=True)
+        with self._cache_lock:
+            filtered_posts = self._filtered_posts
+            ranked = filtered_posts.get(filter_type)
+            posts, by_priority = self.recent_posts, self._by_priority
+        
+        if ranked is None:
+            if filter_type == 'high_priority':
+                posts = by_priority.get('high', [])
+            elif filter_type in self._POST_FILTERS:
+                posts = list(filter(self._POST_FILTERS[filter_type], posts))
+            
+            # recent_posts is already newest first, so 'new' needs no sort
+            if filter_type != 'new':
+                posts = sorted(
+                    posts,
+                    key=self._POST_SORT_KEYS.get(filter_type, itemgetter('business_score')),
+                    reverse=True
+                )
+            ranked = posts
+            
+            # Posts are immutable once cached, so the ranking holds until the next update
+            with self._cache_lock:
+                filtered_posts[filter_type] = ranked
         
-        return posts[:limit]
+        return self._with_time_ago(ranked[:limit])
     
     def perform_quick_action(self, action_type: str, post_id: str, **kwargs) -> Dict[str, Any]:
         """
@@ -332,7 +471,8 @@ class LiveRedditService:
             Dictionary with action result
         """
         try:
-            post = self.post_cache.get(post_id)
+            with self._cache_lock:
+                post = self.post_cache.get(post_id)
             if not post:
                 return {'success': False, 'error': 'Post not found in cache'}
             
@@ -442,18 +582,22 @@ class LiveRedditService:
     
     def get_monitoring_stats(self) -> Dict[str, Any]:
         """Get live monitoring statistics"""
-        high_priority = len([p for p in self.recent_posts if p.get('priority') == 'high'])
-        medium_priority = len([p for p in self.recent_posts if p.get('priority') == 'medium'])
+        with self._cache_lock:
+            total_posts = len(self.recent_posts)
+            priority_counts = self._priority_counts
+            business_score_sum = self._business_score_sum
         
         return {
             'is_monitoring': self.is_monitoring,
             'last_update': self.last_update.isoformat() if self.last_update else None,
-            'total_posts_cached': len(self.recent_posts),
-            'high_priority_posts': high_priority,
-            'medium_priority_posts': medium_priority,
+            'total_posts_cached': total_posts,
+            'queued_posts': self._fetch_queue.qsize(),
+            'dropped_posts': self.dropped_posts,
+            'high_priority_posts': priority_counts['high'],
+            'medium_priority_posts': priority_counts['medium'],
             'monitored_subreddits': self.config['monitored_subreddits'],
             'update_interval': self.config['update_interval'],
-            'average_business_score': sum(p.get('business_score', 0) for p in self.recent_posts) / len(self.recent_posts) if self.recent_posts else 0
+            'average_business_score': business_score_sum / total_posts if total_posts else 0
         }
     
     def update_monitoring_config(self, config_updates: Dict):
@@ -484,8 +628,12 @@ class LiveRedditService:
     def close(self):
         """Clean up live Reddit service"""
         self.stop_live_monitoring()
-        self.recent_posts.clear()
-        self.post_cache.clear()
+        with self._cache_lock:
+            self.recent_posts = []
+            self.post_cache.clear()
+            self._expiry.clear()
+            self._index_recent_posts()
         self.update_callbacks.clear()
+        self._ai_pool.shutdown(wait=False)
         
         self.logger.info("Live Reddit service closed")
\ No newline at end of file
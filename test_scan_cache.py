@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test ScanCache TTL and stale-on-error behaviour
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+def test_scan_cache():
+    """Test fresh hits, TTL misses and the stale fallbacks"""
+    print("Testing Scan Cache...")
+    
+    try:
+        from utils.scan_cache import ScanCache
+        
+        cache_file = os.path.join(tempfile.mkdtemp(), "scan_cache.json")
+        cache = ScanCache(cache_file)
+        calls = []
+        
+        def scan():
+            calls.append(1)
+            return [{'title': f'post {len(calls)}'}]
+        
+        def failing_scan():
+            raise RuntimeError("network down")
+        
+        # Fresh hit: the second call inside the TTL doesn't scan again
+        first = cache.get_or_scan('reddit:test', 60, scan)
+        second = cache.get_or_scan('reddit:test', 60, scan)
+        assert first == second and len(calls) == 1, "fresh entry should be served from cache"
+        print("OK Fresh entry served from cache")
+        
+        # TTL miss: an expired entry triggers a new scan
+        time.sleep(0.01)
+        third = cache.get_or_scan('reddit:test', 0, scan)
+        assert len(calls) == 2 and third == [{'title': 'post 2'}], "expired entry should be rescanned"
+        print("OK Expired entry rescanned")
+        
+        # Stale-on-error: a failing scan falls back to the last value
+        stale = cache.get_or_scan('reddit:test', 0, failing_scan)
+        assert stale == third, "failed scan should return the cached value"
+        print("OK Failed scan served stale value")
+        
+        # Empty results (swallowed errors) also fall back and are never cached
+        stale = cache.get_or_scan('reddit:test', 0, lambda: [])
+        assert stale == third, "empty scan should return the cached value"
+        empty = cache.get_or_scan('rss:test', 60, lambda: {'ai_news': [], 'health': []})
+        assert empty == {'ai_news': [], 'health': []}
+        assert cache.get_or_scan('rss:test', 60, lambda: {'ai_news': ['a']}) == {'ai_news': ['a']}, \
+            "all-empty dict result should not have been cached"
+        print("OK Empty results served stale value and were not cached")
+        
+        # No cached value: the scan error propagates
+        try:
+            cache.get_or_scan('youtube:test', 60, failing_scan)
+            raise AssertionError("error should propagate without a cached value")
+        except RuntimeError:
+            print("OK Error propagated without cached value")
+        
+        # Entries survive a save/reload
+        cache.save()
+        reloaded = ScanCache(cache_file)
+        assert reloaded.get_or_scan('reddit:test', 60, failing_scan) == third
+        print("OK Cache reloaded from disk")
+        
+        print("OK Scan Cache test completed successfully!")
+        return True
+    
+    except Exception as e:
+        print(f"FAILED Scan Cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    success = test_scan_cache()
+    sys.exit(0 if success else 1)
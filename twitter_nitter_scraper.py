@@ -17,7 +17,9 @@ if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
 
 
 class TwitterNitterScraper:
-    def __init__(self):
+    def __init__(self, session=None):
+        self.session = session or requests.Session()
+
         # Load account list
         config_path = Path(__file__).parent / 'twitter_monitoring_accounts.json'
         with open(config_path, 'r') as f:
@@ -49,7 +51,7 @@ class TwitterNitterScraper:
         """Find a working Nitter instance"""
         for instance in self.nitter_instances:
             try:
-                response = requests.get(instance, timeout=5)
+                response = self.session.get(instance, timeout=5)
                 if response.status_code == 200:
                     return instance
             except Exception:
@@ -0,0 +1,72 @@
+"""
+SQLite-backed store for sentence embeddings shared between runs
+"""
+
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+class EmbeddingStore:
+    """
+    Persist embeddings on disk so restarts don't re-encode seen texts
+
+    Embeddings are deterministic for a given model and text, so entries never
+    expire; rows are keyed by model name plus a text digest, which keeps
+    vectors from different models apart. Vectors are stored as float16 to
+    halve their size and read back as float32.
+    """
+
+    def __init__(self, path: str, model_name: str):
+        self.path = path
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, digest BLOB NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, digest))"
+            )
+
+    def get_many(self, digests: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Look up stored vectors
+
+        Args:
+            digests: Text digests to look up
+
+        Returns:
+            Mapping of digest to vector for the digests that were found
+        """
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(digests), 500):
+                batch = digests[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT digest, vector FROM embeddings WHERE model = ? AND digest IN "
+                    f"({','.join('?' * len(batch))})",
+                    (self.model_name, *batch)
+                ).fetchall()
+                found.update(
+                    (digest, np.frombuffer(vector, dtype=np.float16).astype(np.float32))
+                    for digest, vector in rows
+                )
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]]) -> None:
+        """Store (digest, vector) pairs, replacing existing entries"""
+        rows = [(self.model_name, digest, np.asarray(vector, dtype=np.float16).tobytes())
+                for digest, vector in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, digest, vector) VALUES (?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
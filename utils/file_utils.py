@@ -0,0 +1,72 @@
+"""
+File helpers for writing and archiving digest outputs
+"""
+
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Optional
+
+# Large outputs (multi-MB HTML/JSON) go out in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = 'w', encoding: Optional[str] = 'utf-8'):
+    """
+    Open a temporary file that replaces path once the block exits cleanly
+
+    The destination is swapped for a new file rather than truncated in
+    place, so readers never see a half-written file and any hardlinked
+    snapshot of the previous version keeps its contents. If the block
+    raises, the temporary file is removed and path is left untouched.
+
+    Args:
+        path: Destination file path
+        mode: 'w' for text or 'wb' for bytes
+        encoding: Text encoding (ignored for binary mode)
+    """
+    tmp_path = f"{path}.tmp"
+    if 'b' in mode:
+        encoding = None
+    try:
+        with open(tmp_path, mode, encoding=encoding, buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to path atomically (see atomic_open)"""
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+
+
+def atomic_write_text(path: str, text: str, encoding: str = 'utf-8') -> None:
+    """Write text to path atomically (see atomic_open)"""
+    with atomic_open(path, 'w', encoding=encoding) as f:
+        f.write(text)
+
+
+def snapshot_file(src: str, dst: str) -> None:
+    """
+    Mirror a finished output file into an archive folder
+
+    Uses a hardlink so no bytes are copied, falling back to a regular copy
+    across devices or on filesystems without link support. Only snapshot
+    files whose writers replace them (see atomic_open); a file that
+    is rewritten in place would change the snapshot along with it.
+
+    Args:
+        src: Source file path
+        dst: Snapshot file path
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
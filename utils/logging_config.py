@@ -4,6 +4,7 @@ Logging configuration for PersonalizedReddit application
 
 import logging
 import logging.handlers
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -119,11 +120,18 @@ class LogCapture:
         """Get captured logs"""
         return self.logs.copy()
 
+# Timing decorators only wrap functions when profiling is switched on; set
+# before the decorated modules are imported
+PROFILING_ENABLED = os.environ.get('LIVE_REDDIT_PROFILE') == '1'
+
 def log_performance(func):
-    """Decorator to log function performance"""
+    """Decorator to log function performance (a no-op unless PROFILING_ENABLED)"""
     import time
     from functools import wraps
     
+    if not PROFILING_ENABLED:
+        return func
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         logger = get_logger(func.__module__)
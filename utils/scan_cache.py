@@ -0,0 +1,98 @@
+"""
+File-backed TTL cache for scanner results shared between digest runs
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from utils.file_utils import atomic_write_text
+
+# How old a cached result may be and still stand in for a failed scan
+MAX_STALE_SECONDS = 24 * 3600
+
+
+def _is_empty(value: Any) -> bool:
+    """True for empty results, including dicts whose values are all empty (e.g. RSS categories)"""
+    if isinstance(value, dict):
+        return not any(value.values())
+    return not value
+
+
+class ScanCache:
+    """
+    Cache scanner outputs on disk with a per-entry TTL
+
+    Each run of the digest is a separate process, so results are kept in a
+    JSON file and reused by the next run while still fresh. When a scan
+    raises or comes back empty, the last cached value is returned instead
+    (stale-on-error) as long as it is younger than MAX_STALE_SECONDS.
+    Scanners tend to catch their own errors and return nothing, so an
+    empty result is treated as a failure and never cached.
+    """
+
+    def __init__(self, cache_file: str = ".scan_cache.json"):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get_or_scan(self, key: str, ttl: int, scan: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key if younger than ttl, else run scan
+
+        Args:
+            key: Cache key, e.g. "reddit:entrepreneur"
+            ttl: Seconds a cached value stays fresh
+            scan: Zero-argument callable producing the value
+
+        Returns:
+            Fresh cached value, new scan result, or stale value if scan failed or
+            came back empty
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and now - entry['saved_at'] < ttl:
+            return entry['value']
+
+        stale_ok = entry is not None and now - entry['saved_at'] < MAX_STALE_SECONDS
+        try:
+            value = scan()
+        except Exception:
+            if stale_ok:
+                print(f"⚠️ {key}: scan failed, using cached result")
+                return entry['value']
+            raise
+        
+        # Empty results are usually swallowed errors - don't pin them for a whole TTL
+        if _is_empty(value):
+            if stale_ok:
+                print(f"⚠️ {key}: scan returned nothing, using cached result")
+                return entry['value']
+            return value
+        
+        with self._lock:
+            self._entries[key] = {'saved_at': now, 'value': value}
+            self._dirty = True
+        return value
+
+    def save(self) -> None:
+        """Write the cache file if anything changed during this run"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                atomic_write_text(self.cache_file, json.dumps(self._entries, default=str))
+                self._dirty = False
+            except OSError as e:
+                print(f"⚠️ Could not save scan cache: {e}")